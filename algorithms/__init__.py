@@ -0,0 +1 @@
+"""Computation engines behind the portfolio's biotech visualizers."""
@@ -0,0 +1,180 @@
+"""Needleman-Wunsch / Smith-Waterman alignment vectorized along anti-diagonals"""
+import numpy as np
+
+# "Minus infinity" that survives adding a few gap penalties without overflow
+NEG = -(1 << 30)
+
+# Largest magnitude accepted for the match, mismatch and gap scores
+MAX_SCORE = 100
+
+# Traceback moves stored per cell
+STOP, DIAGONAL, UP, LEFT = 0, 1, 2, 3
+
+
+class Alignment:
+    """Result of ``align``: score, gapped strings, path and a sampled score matrix"""
+
+    def __init__(self, score, aligned_a, aligned_b, path, grid, stride, cells):
+        self.score = score
+        self.aligned_a = aligned_a
+        self.aligned_b = aligned_b
+        self.path = path
+        self.grid = grid
+        self.stride = stride
+        self.cells = cells
+
+    def identity(self):
+        """Fraction of alignment columns with identical bases"""
+        if not self.aligned_a:
+            return 0.0
+        same = sum(x == y for x, y in zip(self.aligned_a, self.aligned_b))
+        return same / len(self.aligned_a)
+
+    def match_line(self):
+        """'|' under identical columns, '.' under mismatches, ' ' under gaps"""
+        return "".join(
+            " " if "-" in (x, y) else ("|" if x == y else ".")
+            for x, y in zip(self.aligned_a, self.aligned_b)
+        )
+
+
+def _window(values, lo, start, stop):
+    """``values[i - lo]`` for i in start..stop, NEG where i is outside the diagonal"""
+    out = np.full(stop - start + 1, NEG, dtype=np.int32)
+    first = max(start, lo)
+    last = min(stop, lo + len(values) - 1)
+    if first <= last:
+        out[first - start:last - start + 1] = values[first - lo:last - lo + 1]
+    return out
+
+
+def align(a, b, mode="global", match=1, mismatch=-1, gap=-2, band=None, max_side=512):
+    """Align ``a`` against ``b`` with a linear gap penalty
+
+    ``mode`` is "global" (Needleman-Wunsch) or "local" (Smith-Waterman).
+    The DP matrix is filled one anti-diagonal (i + j = d) at a time: every
+    cell on a diagonal depends only on the two previous diagonals, so each
+    diagonal is a handful of NumPy slice operations. Diagonals are stored
+    contiguously, which keeps all three neighbours as plain slices.
+
+    With ``band`` set, only cells whose offset i - j lies within ``band`` of
+    the main diagonal (widened to cover a length difference) are computed
+    and stored, so time and memory grow linearly with sequence length.
+
+    Only a strided sample of the score matrix (at most ``max_side`` per
+    side) is kept for display, plus one uint8 traceback move per computed
+    cell.
+
+    Scores are int32: each of ``match``, ``mismatch`` and ``gap`` must lie
+    within ``MAX_SCORE``, and no path may score below ``NEG / 2``;
+    otherwise ``ValueError`` is raised.
+    """
+    if mode not in ("global", "local"):
+        raise ValueError(f"Unknown alignment mode: {mode}")
+    local = mode == "local"
+    largest = max(abs(match), abs(mismatch), abs(gap))
+    if largest > MAX_SCORE:
+        raise ValueError(f"Match, mismatch and gap scores must be between -{MAX_SCORE} and {MAX_SCORE}")
+
+    a_codes = np.frombuffer(a.upper().encode("ascii"), dtype=np.uint8)
+    b_reversed = np.frombuffer(b.upper().encode("ascii")[::-1], dtype=np.uint8)
+    m, n = len(a_codes), len(b_reversed)
+    if (m + n) * largest >= -NEG // 2:
+        raise ValueError("Sequences too long for these scores: the alignment score would overflow")
+
+    # Allowed range of i - j for every computed cell
+    if band is None:
+        low_offset, high_offset = -n, m
+    else:
+        low_offset = min(0, m - n) - band
+        high_offset = max(0, m - n) + band
+
+    stride = max(1, -(-(max(m, n) + 1) // max_side))
+    grid = np.full((m // stride + 1, n // stride + 1), np.nan)
+
+    moves = []
+    lows = []
+    previous, previous_lo = np.zeros(0, dtype=np.int32), 0
+    before, before_lo = np.zeros(0, dtype=np.int32), 0
+    best_score, best_cell = NEG, (0, 0)
+    cells = 0
+
+    for d in range(m + n + 1):
+        lo = max(0, d - n, -((-d - low_offset) // 2))
+        hi = min(m, d, (d + high_offset) // 2)
+        size = max(hi - lo + 1, 0)
+        current = np.full(size, NEG, dtype=np.int32)
+        move = np.zeros(size, dtype=np.uint8)
+
+        if size:
+            # Matrix edges: row 0 (i = 0) and column 0 (j = 0)
+            if lo == 0:
+                current[0] = 0 if local else d * gap
+                move[0] = STOP if (local or d == 0) else LEFT
+            if hi == d and d > 0:
+                current[-1] = 0 if local else d * gap
+                move[-1] = STOP if local else UP
+
+            start, stop = max(lo, 1), min(hi, d - 1)
+            if start <= stop:
+                same = a_codes[start - 1:stop] == b_reversed[n - d + start:n - d + stop + 1]
+                diagonal = _window(before, before_lo, start - 1, stop - 1) + np.where(same, match, mismatch)
+                up = _window(previous, previous_lo, start - 1, stop - 1) + gap
+                left = _window(previous, previous_lo, start, stop) + gap
+
+                best = np.maximum(diagonal, np.maximum(up, left))
+                choice = np.where(best == diagonal, DIAGONAL, np.where(best == up, UP, LEFT))
+                if local:
+                    choice[best <= 0] = STOP
+                    best = np.maximum(best, 0)
+                current[start - lo:stop - lo + 1] = np.maximum(best, NEG)
+                move[start - lo:stop - lo + 1] = choice
+
+            if local:
+                top = int(current.argmax())
+                if current[top] > best_score:
+                    best_score, best_cell = int(current[top]), (lo + top, d - lo - top)
+
+            if d % stride == 0:
+                rows = np.arange(-(-lo // stride) * stride, hi + 1, stride)
+                grid[rows // stride, (d - rows) // stride] = current[rows - lo]
+
+        cells += size
+        moves.append(move)
+        lows.append(lo)
+        before, before_lo = previous, previous_lo
+        previous, previous_lo = current, lo
+
+    if local:
+        score, (i, j) = max(best_score, 0), best_cell
+    else:
+        score, (i, j) = int(previous[m - previous_lo]), (m, n)
+
+    aligned_a, aligned_b, path = [], [], [(i, j)]
+    while i > 0 or j > 0:
+        step = moves[i + j][i - lows[i + j]]
+        if step == STOP:
+            break
+        if step == DIAGONAL:
+            i, j = i - 1, j - 1
+            aligned_a.append(a[i])
+            aligned_b.append(b[j])
+        elif step == UP:
+            i -= 1
+            aligned_a.append(a[i])
+            aligned_b.append("-")
+        else:
+            j -= 1
+            aligned_a.append("-")
+            aligned_b.append(b[j])
+        path.append((i, j))
+
+    return Alignment(
+        score,
+        "".join(reversed(aligned_a)).upper(),
+        "".join(reversed(aligned_b)).upper(),
+        np.array(path[::-1], dtype=np.int64).reshape(-1, 2),
+        grid,
+        stride,
+        cells,
+    )
@@ -0,0 +1,169 @@
+"""Six-frame DNA -> protein translation over streamed FASTA input"""
+import os
+from collections import deque
+
+import numpy as np
+
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Standard genetic code, codons enumerated with bases in TCAG order
+_BASES_TCAG = "TCAG"
+_AMINO_TCAG = "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG"
+
+# Base codes: A=0, C=1, G=2, T/U=3, anything else (N, IUPAC ambiguity) = 4
+BASE_CODES = np.full(256, 4, dtype=np.uint8)
+for _code, _letters in enumerate(("Aa", "Cc", "Gg", "TtUu")):
+    for _letter in _letters:
+        BASE_CODES[ord(_letter)] = _code
+
+# Complement in code space; unknown bases stay unknown
+COMPLEMENT_CODES = np.array([3, 2, 1, 0, 4], dtype=np.uint8)
+
+CODON_TABLE = {
+    a + b + c: _AMINO_TCAG[16 * _BASES_TCAG.index(a) + 4 * _BASES_TCAG.index(b) + _BASES_TCAG.index(c)]
+    for a in _BASES_TCAG
+    for b in _BASES_TCAG
+    for c in _BASES_TCAG
+}
+
+# Lookup over base-5 codon indices (25 * b0 + 5 * b1 + b2); any unknown base -> X
+AMINO_LOOKUP = np.full(125, ord("X"), dtype=np.uint8)
+for _codon, _amino in CODON_TABLE.items():
+    _b0, _b1, _b2 = (int(BASE_CODES[ord(base)]) for base in _codon)
+    AMINO_LOOKUP[25 * _b0 + 5 * _b1 + _b2] = ord(_amino)
+
+FRAMES = ("+1", "+2", "+3", "-1", "-2", "-3")
+
+# Characters dropped from sequence lines
+_SKIP = b" \t\r\n0123456789*-."
+
+
+def read_fasta_chunks(stream, chunk_size=CHUNK_SIZE):
+    """Yield ``(record_number, name, sequence_bytes)`` pieces from a binary stream
+
+    Headers may straddle read boundaries; sequence lines are joined and
+    stripped of whitespace. Input without a ``>`` header is treated as one
+    unnamed record, so pasted raw sequence works too. Records with no
+    sequence produce no pieces.
+    """
+    record, name = 0, None
+    pending = b""
+    line_start = True
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        data = pending + block
+        pending = b""
+        pos = 0
+        while pos < len(data):
+            if data[pos:pos + 1] == b">" and (pos > 0 or line_start):
+                end = data.find(b"\n", pos)
+                if end == -1:
+                    pending = data[pos:]
+                    break
+                record += 1
+                name = data[pos + 1:end].strip().decode("utf-8", "replace")
+                pos = end + 1
+                continue
+            header = data.find(b"\n>", pos)
+            stop = len(data) if header == -1 else header + 1
+            sequence = data[pos:stop].translate(None, _SKIP)
+            pos = stop
+            if sequence:
+                yield record, name, sequence
+        line_start = bool(pending) or data.endswith(b"\n")
+
+
+def translate_piece(task):
+    """Translate one sequence piece starting at global position ``start``
+
+    Returns three forward-frame proteins (frames by start position modulo 3)
+    and three reverse-strand proteins grouped the same way, still in forward
+    order; ``translate_fasta`` reverses and relabels those per record.
+    """
+    sequence, start = task
+    codes = BASE_CODES[np.frombuffer(sequence, dtype=np.uint8)]
+    if len(codes) < 3:
+        return (b"",) * 6
+
+    wide = codes.astype(np.uint16)
+    forward = AMINO_LOOKUP[25 * wide[:-2] + 5 * wide[1:-1] + wide[2:]]
+    complement = COMPLEMENT_CODES[codes].astype(np.uint16)
+    reverse = AMINO_LOOKUP[25 * complement[2:] + 5 * complement[1:-1] + complement[:-2]]
+
+    offsets = [(phase - start) % 3 for phase in range(3)]
+    return tuple(forward[i::3].tobytes() for i in offsets) + tuple(reverse[i::3].tobytes() for i in offsets)
+
+
+def _tasks(stream, chunk_size):
+    """Split records into overlapping translate_piece tasks
+
+    Each piece carries the previous piece's last two bases so codons that
+    span a chunk boundary are translated exactly once.
+    """
+    current, carry, position = None, b"", 0
+    for record, name, sequence in read_fasta_chunks(stream, chunk_size):
+        if record != current:
+            current, carry, position = record, b"", 0
+        buffer = carry + sequence
+        yield record, name, len(sequence), (buffer, position - len(carry))
+        position += len(sequence)
+        carry = buffer[-2:]
+
+
+def _ordered_results(tasks, executor, max_pending):
+    """Run tasks through ``executor`` (or inline) keeping input order"""
+    if executor is None:
+        for record, name, length, task in tasks:
+            yield record, name, length, translate_piece(task)
+        return
+
+    pending = deque()
+    for record, name, length, task in tasks:
+        pending.append((record, name, length, executor.submit(translate_piece, task)))
+        if len(pending) >= max_pending:
+            record, name, length, future = pending.popleft()
+            yield record, name, length, future.result()
+    while pending:
+        record, name, length, future = pending.popleft()
+        yield record, name, length, future.result()
+
+
+def _finish_record(name, length, parts):
+    """Join a record's per-phase pieces into the six labelled frames"""
+    frames = {f"+{phase + 1}": b"".join(parts[phase]) for phase in range(3)}
+    for phase in range(3):
+        # Reverse frame r reads the reverse complement from offset r, i.e.
+        # forward codon starts with (length - phase) % 3 == r
+        frame = (length - phase) % 3
+        frames[f"-{frame + 1}"] = b"".join(parts[3 + phase])[::-1]
+    return name, length, {label: frames[label] for label in FRAMES}
+
+
+def translate_fasta(stream, chunk_size=CHUNK_SIZE, executor=None, max_pending=None):
+    """Yield ``(name, length, frames)`` per record of a FASTA/raw sequence stream
+
+    ``frames`` maps "+1".."-3" to protein bytes ("*" = stop, "X" = codon with
+    an unknown base). Input is read in ``chunk_size`` pieces; pass a
+    ``concurrent.futures`` executor (e.g. a process pool) to translate
+    pieces in parallel while keeping at most ``max_pending`` in flight
+    (by default two per CPU, so every worker of a CPU-sized pool has a
+    piece queued behind the one it is translating).
+    """
+    if max_pending is None:
+        max_pending = 2 * (os.cpu_count() or 1) if executor is not None else 1
+
+    current, name, length, parts = None, None, 0, None
+    for record, record_name, piece_length, result in _ordered_results(
+        _tasks(stream, chunk_size), executor, max_pending
+    ):
+        if record != current:
+            if parts is not None:
+                yield _finish_record(name, length, parts)
+            current, name, length, parts = record, record_name, 0, [[] for _ in range(6)]
+        length += piece_length
+        for phase, protein in enumerate(result):
+            parts[phase].append(protein)
+    if parts is not None:
+        yield _finish_record(name, length, parts)
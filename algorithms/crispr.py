@@ -0,0 +1,286 @@
+"""CRISPR guide-RNA finder over a memory-mapped FASTA with a seed k-mer index"""
+import mmap
+import os
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from algorithms.codon import BASE_CODES, COMPLEMENT_CODES
+
+# IUPAC letters -> allowed base codes (A=0, C=1, G=2, T=3)
+IUPAC = {
+    "A": (0,), "C": (1,), "G": (2,), "T": (3,),
+    "R": (0, 2), "Y": (1, 3), "S": (1, 2), "W": (0, 3), "K": (2, 3), "M": (0, 1),
+    "B": (1, 2, 3), "D": (0, 2, 3), "H": (0, 1, 3), "V": (0, 1, 2),
+    "N": (0, 1, 2, 3),
+}
+
+# 3' PAMs offered in the UI
+PAM_PRESETS = {
+    "NGG (SpCas9)": "NGG",
+    "NAG (SpCas9, weak)": "NAG",
+    "NGA (SpCas9-VQR)": "NGA",
+    "NNGRRT (SaCas9)": "NNGRRT",
+}
+
+CHUNK_SIZE = 32 * 1024 * 1024
+
+_BASE_LETTERS = np.frombuffer(b"ACGT", dtype=np.uint8)
+_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _pam_mask(codes, pam, count, offset, reverse):
+    """Boolean mask over ``count`` window starts whose PAM matches ``pam``
+
+    Forward sites read the PAM at ``start + offset``; reverse-strand sites
+    read the reverse complement of ``codes[start:start + len(pam)]``.
+    """
+    mask = np.ones(count, dtype=bool)
+    for k, letter in enumerate(pam.upper()):
+        allowed = IUPAC[letter]
+        if len(allowed) == 4:
+            continue
+        if reverse:
+            column = COMPLEMENT_CODES[codes[len(pam) - 1 - k:len(pam) - 1 - k + count]]
+        else:
+            column = codes[offset + k:offset + k + count]
+        mask &= np.isin(column, allowed)
+    return mask
+
+
+def _pack(windows):
+    """Pack (n, L) base-code windows into uint64 2-bit words, first base highest"""
+    weights = np.uint64(1) << (2 * np.arange(windows.shape[1] - 1, -1, -1, dtype=np.uint64))
+    return (windows.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+
+
+def pack_sequence(sequence):
+    """Pack a guide sequence string into its 2-bit uint64 form"""
+    codes = BASE_CODES[np.frombuffer(sequence.upper().encode("ascii"), dtype=np.uint8)]
+    if (codes > 3).any():
+        raise ValueError("Guide sequences may only contain A, C, G and T")
+    return _pack(codes[None, :])[0]
+
+
+def unpack(word, length):
+    """2-bit packed protospacer back to its sequence string"""
+    shifts = 2 * np.arange(length - 1, -1, -1, dtype=np.uint64)
+    codes = (np.uint64(word) >> shifts) & np.uint64(3)
+    return _BASE_LETTERS[codes.astype(np.intp)].tobytes().decode()
+
+
+def _sites_in_chunk(codes, pam, length):
+    """Packed protospacers and their chunk-relative starts on both strands"""
+    span = length + len(pam)
+    if len(codes) < span:
+        empty = np.zeros(0, dtype=np.uint64)
+        return empty, np.zeros(0, dtype=np.int64), empty, np.zeros(0, dtype=np.int64)
+
+    windows = sliding_window_view(codes, span)
+    # A window is usable only if it holds no unknown base: prefix sums of the
+    # unknown-base flags give that per window without touching each window
+    unknown = np.concatenate([[0], np.cumsum(codes > 3, dtype=np.int64)])
+    valid = unknown[span:] == unknown[:-span]
+
+    forward = np.flatnonzero(_pam_mask(codes, pam, len(windows), length, reverse=False) & valid)
+    forward_words = _pack(windows[forward, :length])
+
+    # Reverse strand: PAM revcomp at the window start, protospacer revcomp after it
+    reverse = np.flatnonzero(_pam_mask(codes, pam, len(windows), 0, reverse=True) & valid)
+    reverse_words = _pack(COMPLEMENT_CODES[windows[reverse, len(pam):][:, ::-1]])
+    return forward_words, forward, reverse_words, reverse + len(pam)
+
+
+def scan_fasta(path, pam="NGG", length=20, chunk_size=CHUNK_SIZE):
+    """Memory-map ``path`` and collect every PAM-adjacent protospacer
+
+    Records are walked in ``chunk_size`` slices of the map (headers and line
+    breaks stripped). Each slice is prefixed with the previous slice's last
+    ``span - 1`` bases, so every window is seen exactly once and memory
+    stays bounded by the chunk plus the sites found. Returns ``(names, words,
+    records, positions, strands, bases)``; positions are 0-based starts of
+    the protospacer's leftmost base on the forward strand. An empty file
+    (which cannot be mapped) has no records.
+    """
+    names, words, records, positions, strands = [], [], [], [], []
+    bases = 0
+    overlap = length + len(pam) - 1
+
+    def join(parts, dtype):
+        return np.concatenate(parts).astype(dtype, copy=False) if parts else np.zeros(0, dtype=dtype)
+
+    if os.path.getsize(path) == 0:
+        return (
+            names,
+            join(words, np.uint64),
+            join(records, np.int32),
+            join(positions, np.int64),
+            join(strands, np.int8),
+            bases,
+        )
+
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as genome:
+        header = genome.find(b">")
+        if header == -1:
+            bounds = [(None, 0, len(genome))]
+        else:
+            bounds = []
+            while header != -1:
+                line_end = genome.find(b"\n", header)
+                line_end = len(genome) if line_end == -1 else line_end
+                following = genome.find(b"\n>", line_end)
+                stop = len(genome) if following == -1 else following + 1
+                name = genome[header + 1:line_end].decode("utf-8", "replace").split()[:1]
+                bounds.append((name[0] if name else f"record {len(bounds) + 1}", line_end + 1, stop))
+                header = -1 if following == -1 else following + 1
+
+        for record, (name, start, stop) in enumerate(bounds):
+            names.append(name or "sequence")
+            carry = np.zeros(0, dtype=np.uint8)
+            offset = 0
+            for chunk_start in range(start, stop, chunk_size):
+                raw = genome[chunk_start:min(chunk_start + chunk_size, stop)]
+                fresh = BASE_CODES[np.frombuffer(raw.translate(None, b" \t\r\n"), dtype=np.uint8)]
+                codes = np.concatenate([carry, fresh])
+                base = offset - len(carry)
+
+                forward_words, forward, reverse_words, reverse = _sites_in_chunk(codes, pam, length)
+                for found, strand, starts in ((forward_words, 1, forward), (reverse_words, -1, reverse)):
+                    words.append(found)
+                    positions.append(starts + base)
+                    strands.append(np.full(len(found), strand, dtype=np.int8))
+                    records.append(np.full(len(found), record, dtype=np.int32))
+
+                offset += len(fresh)
+                bases += len(fresh)
+                carry = codes[-overlap:] if overlap else codes[:0]
+
+    return (
+        names,
+        join(words, np.uint64),
+        join(records, np.int32),
+        join(positions, np.int64),
+        join(strands, np.int8),
+        bases,
+    )
+
+
+class GuideIndex:
+    """Seed k-mer index over every PAM-adjacent protospacer of a reference
+
+    Protospacers are split into ``max_mismatches + 1`` seeds. By the
+    pigeonhole principle any site within ``max_mismatches`` of a guide
+    matches it exactly on at least one seed, so off-target candidates come
+    from ``max_mismatches + 1`` binary searches over sorted seed keys and
+    only those candidates are compared base by base.
+    """
+
+    def __init__(self, path, pam="NGG", length=20, max_mismatches=3, chunk_size=CHUNK_SIZE):
+        if not 1 <= length <= 32:
+            raise ValueError("Protospacer length must be between 1 and 32 to pack into 64 bits")
+        if not 0 <= max_mismatches < length:
+            raise ValueError("max_mismatches must be between 0 and the protospacer length")
+        self.pam = pam
+        self.length = length
+        self.max_mismatches = max_mismatches
+
+        start = time.perf_counter()
+        (self.names, self.words, self.records, self.positions,
+         self.strands, self.bases) = scan_fasta(path, pam, length, chunk_size)
+        scanned = time.perf_counter()
+
+        self.seeds = []
+        edges = np.linspace(0, length, max_mismatches + 2).astype(int)
+        for seed_start, seed_stop in zip(edges[:-1], edges[1:]):
+            shift = np.uint64(2 * (length - seed_stop))
+            mask = np.uint64((1 << (2 * (seed_stop - seed_start))) - 1)
+            key_type = np.uint16 if seed_stop - seed_start <= 8 else np.uint32
+            keys = ((self.words >> shift) & mask).astype(key_type)
+            order = np.argsort(keys, kind="stable").astype(np.int32)
+            self.seeds.append((shift, mask, keys[order], order))
+        finished = time.perf_counter()
+
+        self.scan_seconds = scanned - start
+        self.build_seconds = finished - start
+
+    def __len__(self):
+        return len(self.words)
+
+    def nbytes(self):
+        """Approximate memory held by the index arrays"""
+        total = self.words.nbytes + self.records.nbytes + self.positions.nbytes + self.strands.nbytes
+        return total + sum(keys.nbytes + order.nbytes for _, _, keys, order in self.seeds)
+
+    def candidates(self, word):
+        """Site ids sharing at least one exact seed with packed guide ``word``"""
+        found = []
+        for shift, mask, keys, order in self.seeds:
+            # Same dtype as the keys, or searchsorted would upcast the whole array
+            seed = keys.dtype.type((np.uint64(word) >> shift) & mask)
+            lo = np.searchsorted(keys, seed, side="left")
+            hi = np.searchsorted(keys, seed, side="right")
+            found.append(order[lo:hi])
+        return np.unique(np.concatenate(found))
+
+    def mismatches(self, word, site_ids):
+        """Base mismatches between ``word`` and each site (2-bit XOR popcount)"""
+        diff = self.words[site_ids] ^ np.uint64(word)
+        per_base = (diff | (diff >> np.uint64(1))) & np.uint64(0x5555555555555555)
+        return _POPCOUNT[per_base.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+    def off_targets(self, word, max_mismatches=None):
+        """(site ids, mismatch counts) within ``max_mismatches`` of ``word``"""
+        limit = self.max_mismatches if max_mismatches is None else min(max_mismatches, self.max_mismatches)
+        site_ids = self.candidates(word)
+        counts = self.mismatches(word, site_ids)
+        keep = counts <= limit
+        return site_ids[keep], counts[keep]
+
+    def site(self, site_id):
+        """Human-readable description of one indexed site"""
+        return {
+            "Record": self.names[self.records[site_id]],
+            "Position": int(self.positions[site_id]) + 1,
+            "Strand": "+" if self.strands[site_id] > 0 else "-",
+            "Protospacer": unpack(self.words[site_id], self.length),
+        }
+
+
+def gc_fraction(sequence):
+    """Fraction of G/C bases in a sequence string"""
+    return sum(base in "GC" for base in sequence) / max(len(sequence), 1)
+
+
+def design_guides(index, record=0, start=0, stop=None, limit=50):
+    """Score guides in a record window by GC content and off-target load
+
+    Returns one dict per candidate guide (at most ``limit``), ordered by
+    fewest close off-targets then GC content closest to 50%, plus the
+    average query time in seconds.
+    """
+    stop = np.iinfo(np.int64).max if stop is None else stop
+    in_window = np.flatnonzero(
+        (index.records == record) & (index.positions >= start) & (index.positions < stop)
+    )[:limit]
+
+    rows = []
+    began = time.perf_counter()
+    for site_id in in_window:
+        hits, counts = index.off_targets(index.words[site_id])
+        spectrum = np.bincount(counts, minlength=index.max_mismatches + 1)
+        row = index.site(site_id)
+        row["GC %"] = round(100 * gc_fraction(row["Protospacer"]), 1)
+        # Subtract the guide's own site from the exact-match bucket
+        row["Exact copies"] = int(spectrum[0]) - 1
+        for mismatches in range(1, index.max_mismatches + 1):
+            row[f"{mismatches}-mismatch"] = int(spectrum[mismatches])
+        rows.append(row)
+    per_query = (time.perf_counter() - began) / max(len(in_window), 1)
+
+    rows.sort(key=lambda row: (
+        row["Exact copies"],
+        sum(row[f"{m}-mismatch"] for m in range(1, index.max_mismatches + 1)),
+        abs(row["GC %"] - 50),
+    ))
+    return rows, per_query
@@ -0,0 +1,189 @@
+"""Expression-matrix loading via a Parquet cache, plus plot downsampling"""
+import csv
+import gzip
+import hashlib
+import io
+import os
+import tempfile
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Values held in memory per conversion chunk (rows x columns)
+CHUNK_CELLS = 10_000_000
+
+
+def content_hash(stream, block_size=8 * 1024 * 1024):
+    """SHA-256 of a binary stream's contents; the stream is rewound afterwards"""
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for block in iter(lambda: stream.read(block_size), b""):
+        digest.update(block)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+def _separator(header_line):
+    """Tab for TSV-looking headers, comma otherwise"""
+    return "\t" if header_line.count("\t") >= header_line.count(",") else ","
+
+
+def convert_to_parquet(stream, path, compression=None):
+    """Stream a CSV/TSV matrix into a Parquet file chunk by chunk
+
+    The first column is kept as text (gene/feature IDs); every other column
+    is parsed as float32. Rows per chunk are chosen so a chunk holds about
+    ``CHUNK_CELLS`` values however many samples the file has. Returns
+    ``(rows, columns)``. A file that cannot be parsed (non-numeric values,
+    duplicate sample names, bad encoding or compression) raises
+    ``ValueError`` and leaves nothing behind.
+    """
+    # Unique per call: concurrent sessions may convert the same upload at once
+    descriptor, partial = tempfile.mkstemp(suffix=".part", dir=os.path.dirname(path) or ".")
+    os.close(descriptor)
+    try:
+        return _convert(stream, partial, path, compression)
+    except (ValueError, EOFError, OSError, zlib.error, pa.ArrowException) as error:
+        raise ValueError(f"Could not read the expression matrix: {error}") from error
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+def _convert(stream, partial, path, compression):
+    stream.seek(0)
+    if compression == "gzip":
+        header = gzip.GzipFile(fileobj=stream).readline()
+    else:
+        header = stream.readline()
+    stream.seek(0)
+    header = header.decode("utf-8", "replace")
+    separator = _separator(header)
+    raw_names = next(csv.reader(io.StringIO(header), delimiter=separator), [])
+    duplicates = sorted({name for name in raw_names if raw_names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate column names {', '.join(duplicates)}")
+    names = pd.read_csv(io.StringIO(header), sep=separator, nrows=0).columns.tolist()
+
+    rows_per_chunk = max(1000, CHUNK_CELLS // max(len(names), 1))
+    schema = pa.schema([pa.field(str(names[0]), pa.string())] + [pa.field(str(name), pa.float32()) for name in names[1:]])
+    dtypes = {names[0]: str, **{name: np.float32 for name in names[1:]}}
+
+    rows = 0
+    with pq.ParquetWriter(partial, schema) as writer:
+        chunks = pd.read_csv(
+            stream,
+            sep=separator,
+            chunksize=rows_per_chunk,
+            dtype=dtypes,
+            compression=compression,
+            na_values=["", "NA", "NaN", "nan"],
+        )
+        for chunk in chunks:
+            chunk.columns = [str(name) for name in chunk.columns]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+    os.replace(partial, path)
+    return rows, len(names)
+
+
+def cached_parquet(stream, cache_dir, filename=""):
+    """Parquet copy of an uploaded matrix, converted once per distinct content
+
+    Returns ``(path, cache_hit, seconds)``. The cache key is the SHA-256 of
+    the raw upload, so re-uploading the same file (under any name) skips the
+    conversion entirely.
+    """
+    start = time.perf_counter()
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{content_hash(stream)}.parquet")
+    if os.path.exists(path):
+        return path, True, time.perf_counter() - start
+
+    compression = "gzip" if filename.endswith(".gz") else None
+    convert_to_parquet(stream, path, compression=compression)
+    return path, False, time.perf_counter() - start
+
+
+def matrix_shape(path):
+    """(rows, sample column names) from Parquet metadata, without reading data"""
+    parquet = pq.ParquetFile(path)
+    return parquet.metadata.num_rows, parquet.schema_arrow.names[1:]
+
+
+def read_samples(path, samples):
+    """Selected sample columns as float64 arrays; other columns are never read"""
+    table = pq.read_table(path, columns=list(samples))
+    return {name: table.column(name).to_numpy(zero_copy_only=False).astype(np.float64) for name in samples}
+
+
+def _finite_positions(y):
+    y = np.asarray(y, dtype=np.float64)
+    positions = np.flatnonzero(np.isfinite(y))
+    return positions, y[positions]
+
+
+def minmax_indices(y, points):
+    """Indices of each bucket's minimum and maximum (about ``points`` in total)
+
+    Fully vectorized: values are padded into ``points // 2`` equal buckets
+    and reduced with argmin/argmax along the bucket axis. NaNs are ignored.
+    """
+    positions, values = _finite_positions(y)
+    buckets = max(points // 2, 1)
+    if len(values) <= points:
+        return positions
+
+    size = -(-len(values) // buckets)
+    padded = np.full(size * buckets, np.nan)
+    padded[:len(values)] = values
+    padded = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    keep = ~np.isnan(padded).all(axis=1)
+    lows = np.nanargmin(padded[keep], axis=1) + offsets[keep]
+    highs = np.nanargmax(padded[keep], axis=1) + offsets[keep]
+    return positions[np.unique(np.concatenate([lows, highs]))]
+
+
+def lttb_indices(y, points):
+    """Largest-Triangle-Three-Buckets selection of about ``points`` indices
+
+    Keeps the first and last point; for every bucket in between it picks
+    the point forming the largest triangle with the previously kept point
+    and the next bucket's average. Python only loops over buckets.
+    """
+    positions, values = _finite_positions(y)
+    n = len(values)
+    if points >= n or points < 3:
+        return positions
+
+    x = positions.astype(np.float64)
+    every = (n - 2) / (points - 2)
+    chosen = np.empty(points, dtype=np.int64)
+    chosen[0], chosen[-1] = 0, n - 1
+    anchor = 0
+    for bucket in range(points - 2):
+        start = int(bucket * every) + 1
+        stop = int((bucket + 1) * every) + 1
+        next_stop = min(int((bucket + 2) * every) + 1, n)
+        following = slice(stop, max(next_stop, stop + 1))
+        average_x = x[following].mean()
+        average_y = values[following].mean()
+
+        area = np.abs(
+            (x[anchor] - average_x) * (values[start:stop] - values[anchor])
+            - (x[anchor] - x[start:stop]) * (average_y - values[anchor])
+        )
+        anchor = start + int(area.argmax())
+        chosen[bucket + 1] = anchor
+    return positions[chosen]
+
+
+DOWNSAMPLERS = {
+    "LTTB": lttb_indices,
+    "Min/Max": minmax_indices,
+}
@@ -0,0 +1,79 @@
+"""NumPy helpers that turn large matrices into a single display-sized image"""
+import numpy as np
+
+# Biotech palette shared with the frame player: light teal -> teal -> green
+PALETTE = np.array([
+    [178, 223, 219],
+    [38, 166, 154],
+    [46, 125, 50],
+], dtype=np.float64)
+
+# Purple accent used to draw paths on top of a heatmap
+HIGHLIGHT = (123, 31, 162)
+
+
+def downsample(grid, max_side=512, reduce="mean"):
+    """Block-reduce a 2-D array so neither side exceeds ``max_side``
+
+    ``reduce`` is ``"mean"``, ``"max"`` or ``"min"``. Edge blocks that do not
+    fill a whole tile are padded with edge values before reducing.
+    """
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    factor = max(1, -(-max(rows, cols) // max_side))
+    if factor == 1:
+        return grid
+
+    pad_rows = -rows % factor
+    pad_cols = -cols % factor
+    if pad_rows or pad_cols:
+        grid = np.pad(grid, ((0, pad_rows), (0, pad_cols)), mode="edge")
+    blocks = grid.reshape(grid.shape[0] // factor, factor, grid.shape[1] // factor, factor)
+    if reduce == "max":
+        return blocks.max(axis=(1, 3))
+    if reduce == "min":
+        return blocks.min(axis=(1, 3))
+    return blocks.mean(axis=(1, 3))
+
+
+def colorize(grid, low=None, high=None, mask=None):
+    """Map a 2-D array onto the palette, returning a uint8 RGB image
+
+    Pixels where ``mask`` is False are painted white (background).
+    """
+    values = np.asarray(grid, dtype=np.float64)
+    low = np.nanmin(values) if low is None else low
+    high = np.nanmax(values) if high is None else high
+    scaled = (values - low) / ((high - low) or 1.0)
+    scaled = np.clip(np.nan_to_num(scaled), 0.0, 1.0)
+
+    stops = np.linspace(0.0, 1.0, len(PALETTE))
+    rgb = np.empty(values.shape + (3,), dtype=np.uint8)
+    for channel in range(3):
+        rgb[..., channel] = np.interp(scaled, stops, PALETTE[:, channel])
+    if mask is not None:
+        rgb[~np.asarray(mask, dtype=bool)] = 255
+    return rgb
+
+
+def upscale(image, min_side=256):
+    """Nearest-neighbour repeat a small image until its longer side reaches ``min_side``"""
+    scale = max(1, min_side // max(image.shape[:2]))
+    if scale > 1:
+        image = image.repeat(scale, axis=0).repeat(scale, axis=1)
+    return image
+
+
+def heatmap_image(grid, max_side=512, reduce="mean", min_side=256):
+    """Downsample and colorize ``grid`` into one RGB image for ``st.image``
+
+    Small inputs are upscaled to at least ``min_side`` pixels so individual
+    cells stay visible.
+    """
+    return upscale(colorize(downsample(grid, max_side=max_side, reduce=reduce)), min_side)
+
+
+def draw_path(image, rows, cols, color=HIGHLIGHT):
+    """Paint pixels (rows[k], cols[k]) of an RGB image in place and return it"""
+    image[np.asarray(rows), np.asarray(cols)] = color
+    return image
@@ -0,0 +1,116 @@
+"""Pascal triangle engine: lazily grown rows and image-sized triangle views"""
+import threading
+
+import numpy as np
+
+
+class PascalTriangle:
+    """Pascal rows generated on demand and memoized at regular checkpoints
+
+    Rows are exact Python ints when ``modulus`` is None, otherwise NumPy int64
+    arrays reduced modulo ``modulus``. Storing every row of a big-integer
+    triangle would take gigabytes, so only every ``checkpoint``-th row is
+    kept; any row is then at most ``checkpoint - 1`` additions away. One
+    instance is safe to share between threads (and Streamlit sessions).
+    """
+
+    def __init__(self, modulus=None, checkpoint=64):
+        if modulus is not None and modulus < 2:
+            raise ValueError("modulus must be at least 2")
+        self.modulus = modulus
+        self.checkpoint = checkpoint
+        first = [1] if modulus is None else np.ones(1, dtype=np.int64)
+        self._checkpoints = {0: first}
+        self._lock = threading.Lock()
+
+    def _next_row(self, row):
+        """Row n + 1 from row n"""
+        if self.modulus is None:
+            return [1] + [a + b for a, b in zip(row, row[1:])] + [1]
+        following = np.empty(len(row) + 1, dtype=np.int64)
+        following[0] = following[-1] = 1 % self.modulus
+        np.add(row[:-1], row[1:], out=following[1:-1])
+        following[1:-1] %= self.modulus
+        return following
+
+    def _nearest_checkpoint(self, n):
+        base = n - n % self.checkpoint
+        with self._lock:
+            while base not in self._checkpoints:
+                base -= self.checkpoint
+            return base, self._checkpoints[base]
+
+    def rows(self, start=0, stop=None):
+        """Yield rows ``start``..``stop - 1`` lazily (forever if ``stop`` is None)"""
+        index, row = self._nearest_checkpoint(start)
+        while stop is None or index < stop:
+            if index >= start:
+                yield row
+            row = self._next_row(row)
+            index += 1
+            if index % self.checkpoint == 0 and index not in self._checkpoints:
+                with self._lock:
+                    self._checkpoints.setdefault(index, row)
+
+    def row(self, n):
+        """Row ``n`` (0-indexed)"""
+        base, _ = self._nearest_checkpoint(n)
+        if self.modulus is not None or n - base <= 8:
+            for row in self.rows(n, n + 1):
+                return row
+
+        # Far from any checkpoint: C(n, k + 1) = C(n, k) * (n - k) // (k + 1)
+        # needs O(n) big-int operations rather than O(n) rows of additions
+        half = [1]
+        for k in range(n // 2):
+            half.append(half[-1] * (n - k) // (k + 1))
+        mirror = half[::-1] if n % 2 else half[-2::-1]
+        return half + mirror
+
+
+def _centered_samples(n, max_side):
+    """Sampled (row, entry, inside) grids for drawing an n-row triangle centred
+
+    The picture is 2n - 1 columns wide with each entry spanning two columns;
+    rows and columns are strided so neither image side exceeds ``max_side``.
+    """
+    stride = max(1, -(-(2 * n - 1) // max_side))
+    y = np.arange(0, n, stride, dtype=np.int64)[:, None]
+    x = np.arange(0, 2 * n - 1, stride, dtype=np.int64)[None, :]
+    offset = x - (n - 1 - y)
+    inside = (offset >= 0) & (offset <= 2 * y + 1)
+    entry = np.clip(offset >> 1, 0, y)
+    return y, entry, inside
+
+
+def odd_mask(n, max_side=512):
+    """Sierpinski view: True where C(row, k) is odd, for an ``n``-row triangle
+
+    Uses Lucas' theorem (C(r, k) is odd iff ``k & (r - k) == 0``), so no
+    coefficients are computed and ``n`` can be in the millions. Returns
+    ``(odd, inside)`` boolean images; ``inside`` marks pixels in the triangle.
+    """
+    y, entry, inside = _centered_samples(n, max_side)
+    odd = ((entry & (y - entry)) == 0) & inside
+    return odd, inside
+
+
+def residue_grid(triangle, n, max_side=512):
+    """Centred image of row entries modulo ``triangle.modulus`` for ``n`` rows
+
+    Rows are streamed from ``triangle`` and only the sampled ones are kept,
+    so memory stays proportional to the image rather than the triangle.
+    """
+    y, entry, inside = _centered_samples(n, max_side)
+    grid = np.zeros(inside.shape, dtype=np.int64)
+    wanted = iter(y[:, 0].tolist())
+    target = next(wanted, None)
+    position = 0
+    for index, row in enumerate(triangle.rows(0, n)):
+        if index != target:
+            continue
+        grid[position] = np.asarray(row)[entry[position]]
+        position += 1
+        target = next(wanted, None)
+    grid[~inside] = 0
+    return grid, inside
@@ -0,0 +1,179 @@
+"""Sliding-window GC content / skew and k-mer spectra over streamed FASTA input"""
+import numpy as np
+
+from algorithms.codon import BASE_CODES, CHUNK_SIZE, read_fasta_chunks
+
+# Bases per stored count block; windows and steps are whole blocks
+BLOCK = 100
+
+# Largest k whose full 4**k count table (8 MB at k = 10) is kept in memory
+MAX_K = 10
+
+_BASE_LETTERS = np.frombuffer(b"ACGT", dtype=np.uint8)
+A, C, G, T, UNKNOWN = range(5)
+
+
+class SequenceProfile:
+    """Per-block base counts of one record
+
+    ``counts[b, code]`` is how many bases with that code (A, C, G, T,
+    unknown) block ``b`` holds. Any window made of whole blocks is then a
+    difference of two prefix sums, so changing the window size or step
+    never touches the sequence again.
+    """
+
+    def __init__(self, name, block, counts):
+        self.name = name
+        self.block = block
+        self.counts = counts
+        self.length = int(counts.sum())
+        self._prefix = None
+
+    def prefix(self):
+        """Cumulative counts with a leading zero row (computed once)"""
+        if self._prefix is None:
+            self._prefix = np.zeros((len(self.counts) + 1, 5), dtype=np.int64)
+            np.cumsum(self.counts, axis=0, out=self._prefix[1:])
+        return self._prefix
+
+    def composition(self):
+        """Whole-record base totals keyed by letter"""
+        totals = self.prefix()[-1]
+        return dict(zip("ACGTN", totals.tolist()))
+
+    def windows(self, window, step):
+        """Window centres, GC fraction, GC skew and cumulative skew
+
+        ``window`` and ``step`` are in bases and rounded to whole blocks.
+        GC fraction ignores unknown bases; skew is (G - C) / (G + C). The
+        cumulative skew is the running G - C count at each window's end,
+        whose minimum and maximum mark the likely origin and terminus of
+        replication in bacterial genomes. Fractions are NaN where a window
+        has no usable bases.
+        """
+        prefix = self.prefix()
+        blocks = len(self.counts)
+        width = min(max(1, round(window / self.block)), max(blocks, 1))
+        stride = max(1, round(step / self.block))
+
+        starts = np.arange(0, max(blocks - width, 0) + 1, stride)
+        ends = np.minimum(starts + width, blocks)
+        totals = prefix[ends] - prefix[starts]
+        gc = totals[:, G] + totals[:, C]
+        known = totals[:, :UNKNOWN].sum(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            content = gc / known
+            skew = (totals[:, G] - totals[:, C]) / gc
+        centres = (starts + ends) * self.block / 2
+        cumulative = prefix[ends, G] - prefix[ends, C]
+        return np.minimum(centres, self.length), content, skew, cumulative
+
+
+def _block_counts(codes, block):
+    """(len(codes) // block, 5) counts; ``codes`` must be a whole number of blocks"""
+    rows = len(codes) // block
+    keys = np.repeat(np.arange(rows, dtype=np.int64) * 5, block) + codes
+    return np.bincount(keys, minlength=rows * 5).reshape(rows, 5).astype(np.uint16)
+
+
+def _kmer_indices(codes, k):
+    """Base-4 index of every k-mer in ``codes`` holding only A/C/G/T
+
+    The index is built with k shifted slice adds rather than per-window
+    loops; windows touching an unknown base are dropped with a prefix sum
+    of the unknown-base flags.
+    """
+    count = len(codes) - k + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.uint32)
+    index = np.zeros(count, dtype=np.uint32)
+    for offset in range(k):
+        index <<= 2
+        index |= codes[offset:offset + count] & 3
+    unknown = np.concatenate([[0], np.cumsum(codes == UNKNOWN, dtype=np.int64)])
+    return index[unknown[k:] == unknown[:-k]]
+
+
+def scan_sequences(stream, block=BLOCK, k=6, chunk_size=CHUNK_SIZE):
+    """One streamed pass over a FASTA/raw sequence stream
+
+    Returns ``(profiles, kmer_counts)``: a ``SequenceProfile`` per
+    non-empty record (named by the first word of its header) and the
+    forward-strand counts of all 4**k k-mers across the input. Memory is
+    bounded by one chunk plus the per-block counts; each chunk carries the
+    previous one's partial block and last k - 1 bases, so blocks and
+    k-mers spanning chunk boundaries are counted exactly once.
+    """
+    if not 1 <= block <= 65535:
+        raise ValueError("Block size must be between 1 and 65535 bases")
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}")
+
+    profiles = []
+    kmer_counts = np.zeros(4 ** k, dtype=np.int64)
+    current, name, parts = None, None, []
+    remainder = kmer_tail = np.zeros(0, dtype=np.uint8)
+
+    def finish():
+        if remainder.size:
+            parts.append(np.bincount(remainder, minlength=5).astype(np.uint16)[None, :])
+        counts = np.concatenate(parts) if parts else np.zeros((0, 5), dtype=np.uint16)
+        label = (name or "").split()[:1]
+        profiles.append(SequenceProfile(label[0] if label else f"record {len(profiles) + 1}", block, counts))
+
+    for record, record_name, sequence in read_fasta_chunks(stream, chunk_size):
+        if record != current:
+            if current is not None:
+                finish()
+            current, name, parts = record, record_name, []
+            remainder = kmer_tail = np.zeros(0, dtype=np.uint8)
+        fresh = BASE_CODES[np.frombuffer(sequence, dtype=np.uint8)]
+
+        codes = np.concatenate([remainder, fresh])
+        whole = len(codes) // block * block
+        parts.append(_block_counts(codes[:whole], block))
+        remainder = codes[whole:]
+
+        codes = np.concatenate([kmer_tail, fresh])
+        kmer_counts += np.bincount(_kmer_indices(codes, k), minlength=4 ** k)
+        kmer_tail = codes[max(len(codes) - k + 1, 0):] if k > 1 else codes[:0]
+
+    if current is not None:
+        finish()
+    return profiles, kmer_counts
+
+
+def decode_kmer(index, k):
+    """Base-4 k-mer index back to its sequence string"""
+    shifts = 2 * np.arange(k - 1, -1, -1)
+    return _BASE_LETTERS[(int(index) >> shifts) & 3].tobytes().decode()
+
+
+def top_kmers(kmer_counts, k, limit=20):
+    """(k-mer, count) pairs for the ``limit`` most frequent k-mers"""
+    limit = min(limit, len(kmer_counts))
+    best = np.argpartition(kmer_counts, -limit)[-limit:]
+    best = best[np.argsort(kmer_counts[best])[::-1]]
+    return [(decode_kmer(index, k), int(kmer_counts[index])) for index in best]
+
+
+def kmer_spectrum(kmer_counts):
+    """Frequency spectrum: ``spectrum[c]`` distinct k-mers seen exactly c times"""
+    return np.bincount(kmer_counts)
+
+
+def synthetic_genome(length=4_600_000, seed=0):
+    """FASTA bytes of a random circular-genome stand-in with strand-biased G/C
+
+    The leading half is G-rich and the lagging half C-rich, so the
+    cumulative skew bottoms out at the "origin" and peaks at the "terminus"
+    like a real bacterial chromosome.
+    """
+    rng = np.random.default_rng(seed)
+    half = length // 2
+    leading = rng.choice(_BASE_LETTERS, half, p=[0.24, 0.24, 0.28, 0.24])
+    lagging = rng.choice(_BASE_LETTERS, length - half, p=[0.24, 0.28, 0.24, 0.24])
+    sequence = np.concatenate([leading, lagging]).tobytes()
+    lines = b"\n".join(sequence[i:i + 80] for i in range(0, len(sequence), 80))
+    return b">synthetic_chromosome\n" + lines + b"\n"
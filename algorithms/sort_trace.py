@@ -0,0 +1,207 @@
+"""Sort trace engine: run a sort once and record every operation it performs"""
+from array import array
+
+import numpy as np
+
+# Operation codes stored in the first column of a trace log
+COMPARE = 0
+SWAP = 1
+WRITE = 2
+
+OP_NAMES = {COMPARE: "compare", SWAP: "swap", WRITE: "write"}
+
+
+def _bubble_sort(a, ops):
+    """Bubble sort with early exit once a pass makes no swaps"""
+    n = len(a)
+    for i in range(n):
+        swapped = False
+        for j in range(n - i - 1):
+            ops.extend((COMPARE, j, j + 1))
+            if a[j] > a[j + 1]:
+                a[j], a[j + 1] = a[j + 1], a[j]
+                ops.extend((SWAP, j, j + 1))
+                swapped = True
+        if not swapped:
+            break
+
+
+def _insertion_sort(a, ops):
+    """Insertion sort expressed as adjacent swaps so every move is visible"""
+    for i in range(1, len(a)):
+        j = i
+        while j > 0:
+            ops.extend((COMPARE, j - 1, j))
+            if a[j - 1] <= a[j]:
+                break
+            a[j - 1], a[j] = a[j], a[j - 1]
+            ops.extend((SWAP, j - 1, j))
+            j -= 1
+
+
+def _quick_sort(a, ops):
+    """Iterative Lomuto quicksort with a middle pivot (no recursion limit)"""
+    stack = [(0, len(a) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if lo >= hi:
+            continue
+        mid = (lo + hi) // 2
+        if mid != hi:
+            a[mid], a[hi] = a[hi], a[mid]
+            ops.extend((SWAP, mid, hi))
+        pivot = a[hi]
+        store = lo
+        for i in range(lo, hi):
+            ops.extend((COMPARE, i, hi))
+            if a[i] < pivot:
+                if i != store:
+                    a[i], a[store] = a[store], a[i]
+                    ops.extend((SWAP, i, store))
+                store += 1
+        if store != hi:
+            a[store], a[hi] = a[hi], a[store]
+            ops.extend((SWAP, store, hi))
+        stack.append((lo, store - 1))
+        stack.append((store + 1, hi))
+
+
+def _merge_sort(a, ops):
+    """Bottom-up merge sort; merged values are written back in place"""
+    n = len(a)
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid >= hi:
+                continue
+            aux = a[lo:hi]
+            i, j, split = 0, mid - lo, mid - lo
+            for k in range(lo, hi):
+                if i < split and j < hi - lo:
+                    ops.extend((COMPARE, lo + i, lo + j))
+                    take_left = aux[i] <= aux[j]
+                else:
+                    take_left = i < split
+                if take_left:
+                    value = aux[i]
+                    i += 1
+                else:
+                    value = aux[j]
+                    j += 1
+                a[k] = value
+                ops.extend((WRITE, k, value))
+        width *= 2
+
+
+def _heap_sort(a, ops):
+    """In-place max-heap sort"""
+    n = len(a)
+
+    def sift_down(root, end):
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end:
+                ops.extend((COMPARE, child, child + 1))
+                if a[child] < a[child + 1]:
+                    child += 1
+            ops.extend((COMPARE, root, child))
+            if a[root] >= a[child]:
+                return
+            a[root], a[child] = a[child], a[root]
+            ops.extend((SWAP, root, child))
+            root = child
+
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(start, n)
+    for end in range(n - 1, 0, -1):
+        a[0], a[end] = a[end], a[0]
+        ops.extend((SWAP, 0, end))
+        sift_down(0, end)
+
+
+ALGORITHMS = {
+    "Bubble Sort": _bubble_sort,
+    "Insertion Sort": _insertion_sort,
+    "Quick Sort": _quick_sort,
+    "Merge Sort": _merge_sort,
+    "Heap Sort": _heap_sort,
+}
+
+# Largest input each algorithm can trace interactively (quadratic sorts stay small)
+MAX_SIZE = {
+    "Bubble Sort": 500,
+    "Insertion Sort": 1000,
+    "Quick Sort": 10000,
+    "Merge Sort": 10000,
+    "Heap Sort": 10000,
+}
+
+
+class SortTrace:
+    """Initial data plus an (n_ops, 3) int32 log of [op, i, j] rows
+
+    For COMPARE and SWAP rows ``i`` and ``j`` are positions; for WRITE rows
+    ``i`` is the position and ``j`` the value written there.
+    """
+
+    def __init__(self, initial, ops):
+        self.initial = initial
+        self.ops = ops
+
+    def __len__(self):
+        return len(self.ops)
+
+    def counts(self):
+        """Number of recorded operations per operation name"""
+        totals = np.bincount(self.ops[:, 0], minlength=len(OP_NAMES))
+        return {name: int(totals[code]) for code, name in OP_NAMES.items()}
+
+    def final(self):
+        """Array state after replaying the whole log"""
+        for _, state in self.frames(1):
+            return state
+        return self.initial.copy()
+
+    def frames(self, max_frames, max_bars=None):
+        """Replay the log, yielding ``(op_index, state)`` at most ``max_frames`` times
+
+        Frames are spaced evenly over the log, so a 200k-operation trace still
+        plays back in ``max_frames`` chart updates. ``max_bars`` strides each
+        yielded state down to roughly that many values for display.
+        """
+        state = self.initial.tolist()
+        stride = 1
+        if max_bars and len(state) > max_bars:
+            stride = -(-len(state) // max_bars)
+
+        if len(self.ops) == 0:
+            yield 0, np.asarray(state[::stride])
+            return
+
+        boundaries = np.unique(np.linspace(0, len(self.ops), max_frames + 1).astype(int)[1:])
+        rows = self.ops.tolist()
+        start = 0
+        for stop in boundaries:
+            for op, i, j in rows[start:stop]:
+                if op == SWAP:
+                    state[i], state[j] = state[j], state[i]
+                elif op == WRITE:
+                    state[i] = j
+            start = stop
+            yield int(stop), np.asarray(state[::stride])
+
+
+def trace_sort(values, algorithm="Bubble Sort"):
+    """Sort a copy of ``values`` with ``algorithm`` and return its SortTrace"""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown sorting algorithm: {algorithm}")
+
+    initial = np.asarray(values, dtype=np.int32)
+    ops = array("i")
+    ALGORITHMS[algorithm](initial.tolist(), ops)
+    log = np.frombuffer(ops, dtype=np.int32).reshape(-1, 3).copy()
+    return SortTrace(initial.copy(), log)
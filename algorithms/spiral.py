@@ -0,0 +1,36 @@
+"""Vectorized spiral-order generator for the Genomic Matrix visualizer"""
+import numpy as np
+
+
+def spiral_order(n):
+    """(n, n) matrix numbering cells 1..n*n in clockwise spiral fill order
+
+    Python only loops over the n/2 rings; each ring is written as four
+    vectorized slice assignments (top row, right column, bottom row, left
+    column), so a 4000x4000 spiral builds in well under a second.
+    """
+    dtype = np.int32 if n * n < 2 ** 31 else np.int64
+    out = np.empty((n, n), dtype=dtype)
+    numbers = np.arange(1, n * n + 1, dtype=dtype)
+    start = 0
+    for ring in range((n + 1) // 2):
+        last = n - 1 - ring
+        side = last - ring
+        if side == 0:
+            out[ring, ring] = numbers[start]
+            break
+        out[ring, ring:last] = numbers[start:start + side]
+        out[ring:last, last] = numbers[start + side:start + 2 * side]
+        out[last, last:ring:-1] = numbers[start + 2 * side:start + 3 * side]
+        out[last:ring:-1, ring] = numbers[start + 3 * side:start + 4 * side]
+        start += 4 * side
+    return out
+
+
+def ring_ends(n):
+    """Spiral number of the last cell in each ring, outermost first"""
+    rings = np.arange((n + 1) // 2, dtype=np.int64)
+    ends = 4 * (rings + 1) * (n - rings - 1)
+    # An odd-sized matrix ends on a single centre cell rather than a full ring
+    ends[-1] = n * n
+    return ends
@@ -0,0 +1 @@
+"""Page-view recording and aggregation for the portfolio."""
@@ -0,0 +1,162 @@
+"""Buffered page-view log with incrementally maintained monthly aggregates"""
+import calendar
+import sqlite3
+import threading
+import time
+from collections import deque
+
+# Seconds between background flushes of the in-memory buffer
+FLUSH_INTERVAL = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_views (
+    ts REAL NOT NULL,
+    session TEXT NOT NULL,
+    page TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS page_views_ts ON page_views (ts);
+"""
+
+
+def month_of(ts):
+    """``YYYY-MM`` (UTC) of a Unix timestamp"""
+    return time.strftime("%Y-%m", time.gmtime(ts))
+
+
+def previous_month(month):
+    year, number = map(int, month.split("-"))
+    return f"{year - 1}-12" if number == 1 else f"{year}-{number - 1:02d}"
+
+
+def month_start(month):
+    """Unix timestamp at the start of ``month`` (UTC)"""
+    year, number = map(int, month.split("-"))
+    return float(calendar.timegm((year, number, 1, 0, 0, 0)))
+
+
+class MonthTotals:
+    """Views, visitors and visit durations of one month, updated per event"""
+
+    def __init__(self):
+        self.views = 0
+        self.pages = {}
+        # Visitor -> [first, last] view timestamp; a visit lasts from its first view to its last
+        self.visits = {}
+        self.visit_seconds = 0.0
+
+    def add(self, ts, session, page):
+        self.views += 1
+        self.pages[page] = self.pages.get(page, 0) + 1
+        visit = self.visits.get(session)
+        if visit is None:
+            self.visits[session] = [ts, ts]
+        elif ts > visit[1]:
+            self.visit_seconds += ts - visit[1]
+            visit[1] = ts
+
+    def summary(self):
+        visitors = len(self.visits)
+        return {
+            "views": self.views,
+            "visitors": visitors,
+            "avg_visit_seconds": self.visit_seconds / visitors if visitors else 0.0,
+            "pages": dict(self.pages),
+        }
+
+
+class PageViews:
+    """Page views recorded without locks, persisted and aggregated off the request path
+
+    ``record`` only appends to a deque (atomic in CPython), so a rerun pays
+    for one append whatever the traffic. A background thread drains the
+    deque every ``interval`` seconds into an append-only SQLite table in a
+    single transaction, and folds the same batch into per-month totals.
+    Only the current and previous month are kept in memory, so ``summary``
+    costs the same for ten views or ten million. On start the two months
+    are rebuilt from the table, so restarts keep their numbers.
+    """
+
+    def __init__(self, path, interval=FLUSH_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.flushed = 0
+        self._buffer = deque()
+        self._months = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._load()
+
+    def _load(self):
+        """Rebuild the current and previous month's totals from the table"""
+        current = month_of(time.time())
+        since = month_start(previous_month(current))
+        rows = self._connection.execute(
+            "SELECT ts, session, page FROM page_views WHERE ts >= ? ORDER BY ts", (since,)
+        )
+        with self._lock:
+            for ts, session, page in rows:
+                self._months.setdefault(month_of(ts), MonthTotals()).add(ts, session, page)
+
+    def record(self, session, page, ts=None):
+        """Queue one view of ``page`` by ``session``"""
+        self._buffer.append((time.time() if ts is None else ts, session, page))
+
+    def flush(self):
+        """Write every queued view and fold it into the totals; returns how many"""
+        batch = []
+        try:
+            while True:
+                batch.append(self._buffer.popleft())
+        except IndexError:
+            pass
+        if not batch:
+            return 0
+        try:
+            with self._connection:
+                self._connection.executemany("INSERT INTO page_views (ts, session, page) VALUES (?, ?, ?)", batch)
+        except sqlite3.Error:
+            # Put the batch back in front so the next flush retries it in order
+            self._buffer.extendleft(reversed(batch))
+            raise
+        with self._lock:
+            for ts, session, page in batch:
+                self._months.setdefault(month_of(ts), MonthTotals()).add(ts, session, page)
+            current = month_of(time.time())
+            keep = {current, previous_month(current)}
+            for month in [month for month in self._months if month not in keep]:
+                del self._months[month]
+            self.flushed += len(batch)
+        return len(batch)
+
+    def start(self):
+        """Flush in a daemon thread (idempotent)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="pageview-flush", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # A locked or full disk is transient; the views stay queued
+                pass
+
+    def summary(self, now=None):
+        """This month's and last month's totals, plus views still waiting to be flushed"""
+        current = month_of(time.time() if now is None else now)
+        with self._lock:
+            this_month = self._months.get(current, MonthTotals()).summary()
+            last_month = self._months.get(previous_month(current), MonthTotals()).summary()
+        return {"month": current, "current": this_month, "previous": last_month, "pending": len(self._buffer)}
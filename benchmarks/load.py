@@ -0,0 +1,282 @@
+"""Concurrent-session load test against a locally launched portfolio server
+
+Starts `streamlit run Portfolio101.py` on a free local port (a fresh server
+per concurrency level), then opens N websocket sessions at once. Each
+session speaks Streamlit's own protocol, like a browser tab: it walks every
+page, picks every visualizer and presses its button. Reported per level:
+script runs per second across all sessions, p50/p95/p99 rerun latency
+(request sent to script finished) and the server's RSS growth per
+connected session. Linux only (RSS is read from /proc); needs the
+`websockets` package that Streamlit's server already depends on. Usage
+(from the repo root):
+
+    python benchmarks/load.py [--sessions 1 5 10 25] [--rounds 2] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "Portfolio101.py")
+
+sys.path.insert(0, ROOT)
+from diagnostics.timings import percentile  # noqa: E402
+from views import PAGES  # noqa: E402
+from views.algorithms import VISUALIZERS  # noqa: E402
+
+# Widget key of the button that starts each visualizer; the rest run as soon as they are picked
+VISUALIZER_BUTTONS = {
+    "Sequence Alignment Sort": "bubble_sort",
+    "Pairwise Alignment": "align",
+    "Protein Pattern": "pascal",
+    "Genomic Matrix": "spiral",
+    "Gene Expression Sequence": "fibonacci",
+}
+PICKER_LABEL = "Choose Algorithm to Visualize:"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_bytes(pid):
+    """Resident set size of ``pid`` from /proc"""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+class Server:
+    """`streamlit run` of the portfolio in a child process"""
+
+    def __init__(self):
+        self.port = free_port()
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", APP,
+                "--server.headless", "true",
+                "--server.address", "127.0.0.1",
+                "--server.port", str(self.port),
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+            ],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.time() + 60
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1) as response:
+                    if response.status == 200:
+                        return
+            except OSError:
+                if time.time() > deadline or self.process.poll() is not None:
+                    self.stop()
+                    raise RuntimeError("Streamlit server did not start")
+                time.sleep(0.2)
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def rss(self):
+        return rss_bytes(self.process.pid)
+
+    def stop(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class Session:
+    """One browser-like websocket session
+
+    Keeps the value widgets it has set and sends them with every rerun,
+    as the frontend does; button presses are one-shot triggers.
+    """
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.widgets = {}
+        self.values = {}
+        self.query_string = ""
+        self.latencies = []
+        self.errors = 0
+
+    async def rerun(self, trigger=None):
+        """Request a script run and wait for it to finish; returns its latency"""
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query_string
+        for widget_id, value in self.values.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.string_value = value
+        if trigger is not None:
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+
+        self.widgets = {}
+        start = time.perf_counter()
+        await self.websocket.send(msg.SerializeToString())
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.websocket.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    self.errors += 1
+                elif element_type in ("button", "selectbox"):
+                    widget = getattr(element, element_type)
+                    self.widgets[(element_type, widget.label)] = widget.id
+            elif kind == "page_info_changed":
+                self.query_string = forward.page_info_changed.query_string
+            elif kind == "script_finished":
+                break
+        latency = time.perf_counter() - start
+        self.latencies.append(latency)
+        return latency
+
+    def find(self, element_type, label=None, key=None):
+        """Id of a widget from the last run by label or user key, or None"""
+        for (found_type, found_label), widget_id in self.widgets.items():
+            if found_type != element_type:
+                continue
+            if (label is not None and found_label == label) or (key is not None and widget_id.endswith(f"-{key}")):
+                return widget_id
+        return None
+
+    async def tour(self):
+        """Every page, then every visualizer and its button"""
+        for page in PAGES:
+            await self.rerun(self.find("button", key=f"nav_{page}"))
+            if page != "Algorithms":
+                continue
+            for label in VISUALIZERS:
+                button = VISUALIZER_BUTTONS.get(label)
+                picker = self.find("selectbox", label=PICKER_LABEL)
+                if picker is None:
+                    continue
+                self.values[picker] = label
+                await self.rerun()
+                if button is not None and self.find("button", key=button) is not None:
+                    await self.rerun(self.find("button", key=button))
+
+
+async def run_sessions(url, count, rounds):
+    """Open ``count`` sessions at once and tour ``rounds`` times each; returns the sessions"""
+    async def one():
+        websocket = await websockets.connect(url, subprotocols=["streamlit"], max_size=None)
+        session = Session(websocket)
+        await session.rerun()
+        for _ in range(rounds):
+            await session.tour()
+        return session
+
+    return await asyncio.gather(*(one() for _ in range(count)))
+
+
+async def drive(server, count, rounds):
+    """Warm ``server`` with one session, then run ``count`` more at once
+
+    Returns ``(sessions, baseline RSS, RSS with every session connected)``.
+    The warm-up session stays connected throughout, so both readings
+    include the same one-off costs (imports, caches, allocator arenas).
+    """
+    warmup = await run_sessions(server.url, 1, 1)
+    baseline = server.rss()
+    sessions = await run_sessions(server.url, count, rounds)
+    # Measured while every session is still connected and holding its state
+    connected = server.rss()
+    await close(warmup + sessions)
+    return sessions, baseline, connected
+
+
+def measure_level(count, rounds):
+    """Throughput, latency and memory of ``count`` concurrent sessions on a fresh server"""
+    server = Server()
+    peak = [0]
+    sampling = threading.Event()
+
+    def sample():
+        while not sampling.wait(0.1):
+            peak[0] = max(peak[0], server.rss())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        start = time.perf_counter()
+        sessions, baseline, connected = asyncio.run(drive(server, count, rounds))
+        seconds = time.perf_counter() - start
+    finally:
+        sampling.set()
+        sampler.join()
+        server.stop()
+
+    latencies = sorted(latency for session in sessions for latency in session.latencies)
+    return {
+        "sessions": count,
+        "script_runs": len(latencies),
+        "seconds": seconds,
+        "runs_per_second": len(latencies) / seconds,
+        "p50_ms": 1000 * percentile(latencies, 0.50),
+        "p95_ms": 1000 * percentile(latencies, 0.95),
+        "p99_ms": 1000 * percentile(latencies, 0.99),
+        "baseline_rss_mb": baseline / 2 ** 20,
+        "peak_rss_mb": max(peak[0], connected) / 2 ** 20,
+        "rss_per_session_kb": (connected - baseline) / count / 1024,
+        "errors": sum(session.errors for session in sessions),
+    }
+
+
+async def close(sessions):
+    await asyncio.gather(*(session.websocket.close() for session in sessions))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25], help="concurrency levels")
+    parser.add_argument("--rounds", type=int, default=2, help="full tours per session")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    # Sessions driven here stay out of the real page-view analytics
+    scratch = tempfile.TemporaryDirectory()
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch.name, "analytics.sqlite3")
+
+    results = [measure_level(count, args.rounds) for count in args.sessions]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'Sessions':>8} {'Runs':>6} {'Runs/s':>7} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} "
+          f"{'RSS base (MB)':>14} {'RSS peak (MB)':>14} {'RSS/session (KB)':>17} {'Errors':>7}")
+    for row in results:
+        print(f"{row['sessions']:>8} {row['script_runs']:>6} {row['runs_per_second']:>7.1f} {row['p50_ms']:>9.0f} "
+              f"{row['p95_ms']:>9.0f} {row['p99_ms']:>9.0f} {row['baseline_rss_mb']:>14.1f} {row['peak_rss_mb']:>14.1f} "
+              f"{row['rss_per_session_kb']:>17.0f} {row['errors']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Script runs and latency per sidebar navigation click
+
+Counts how many times the app script executes for each page switch (a
+switch that calls st.rerun() costs two runs). Usage (from the repo root):
+
+    python benchmarks/navigation.py [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "Portfolio101.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    # Sessions driven here stay out of the real page-view analytics
+    scratch = tempfile.TemporaryDirectory()
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch.name, "analytics.sqlite3")
+
+    sys.path.insert(0, ROOT)
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    import views
+
+    # The app calls st.set_page_config exactly once per script run
+    runs = [0]
+    set_page_config = st.set_page_config
+
+    def counting_set_page_config(*config_args, **config_kwargs):
+        runs[0] += 1
+        return set_page_config(*config_args, **config_kwargs)
+
+    st.set_page_config = counting_set_page_config
+
+    app = AppTest.from_file(APP, default_timeout=300)
+    app.run()
+    results = []
+    for page in list(views.PAGES)[1:] + [list(views.PAGES)[0]]:
+        runs[0] = 0
+        start = time.perf_counter()
+        app.button(key=f"nav_{page}").click().run()
+        results.append({
+            "page": page,
+            "script_runs": runs[0],
+            "seconds": time.perf_counter() - start,
+            "shown": app.session_state.current_page,
+            "query_params": dict(app.query_params),
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'Navigate to':<12} {'Script runs':>11} {'Time (ms)':>10}  Query params")
+    for row in results:
+        print(f"{row['page']:<12} {row['script_runs']:>11} {1000 * row['seconds']:>10.1f}  {row['query_params']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Websocket payload per script run, before and after hash references
+
+Records every ForwardMsg the app sends and reports, per run, its full size
+and the bytes actually sent to a browser that still holds the previous
+run's messages: cacheable elements it already has go out as a hash
+reference (see views/fragments.py). Usage (from the repo root):
+
+    python benchmarks/payload.py [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "Portfolio101.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    # Sessions driven here stay out of the real page-view analytics
+    scratch = tempfile.TemporaryDirectory()
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch.name, "analytics.sqlite3")
+
+    # .streamlit/config.toml is read from the working directory
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    from streamlit.runtime.forward_msg_cache import create_reference_msg
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    from streamlit.testing.v1 import AppTest
+
+    import views
+
+    sent = []
+    enqueue = ScriptRunContext.enqueue
+
+    def recording_enqueue(self, msg):
+        # enqueue() fills in the content hash and the cacheable flag
+        enqueue(self, msg)
+        reference = create_reference_msg(msg).ByteSize() if msg.metadata.cacheable else None
+        sent.append((msg.hash, msg.ByteSize(), reference))
+
+    ScriptRunContext.enqueue = recording_enqueue
+
+    held = set()
+    results = []
+
+    def measure(label, action):
+        sent.clear()
+        action()
+        full = wire = references = 0
+        for content_hash, size, reference in sent:
+            full += size
+            if reference is not None and content_hash in held:
+                wire += reference
+                references += 1
+            else:
+                wire += size
+        # The browser keeps what this run sent for the next one
+        held.clear()
+        held.update(content_hash for content_hash, _, reference in sent if reference is not None)
+        results.append({"run": label, "messages": len(sent), "full_bytes": full, "sent_bytes": wire, "references": references})
+
+    app = AppTest.from_file(APP, default_timeout=300)
+    measure("first load", app.run)
+    measure("rerun", app.run)
+    for page in list(views.PAGES)[1:] + [list(views.PAGES)[0]]:
+        measure(f"open {page}", lambda: app.button(key=f"nav_{page}").click().run())
+        measure(f"rerun {page}", app.run)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'Run':<22} {'Messages':>8} {'Full (KB)':>10} {'Sent (KB)':>10} {'By reference':>13}")
+    for row in results:
+        print(f"{row['run']:<22} {row['messages']:>8} {row['full_bytes'] / 1024:>10.1f} "
+              f"{row['sent_bytes'] / 1024:>10.1f} {row['references']:>13}")
+
+
+if __name__ == "__main__":
+    main()
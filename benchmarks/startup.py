@@ -0,0 +1,110 @@
+"""Cold-start benchmark: per-page import time and first-paint latency
+
+Every measurement runs in a fresh interpreter, so module caches from one
+page never hide another page's import cost. Usage (from the repo root):
+
+    python benchmarks/startup.py [--repeat 3] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "Portfolio101.py")
+
+# Third-party modules the page split is meant to keep off the startup path
+HEAVY = ("numpy", "pandas", "PIL", "pyarrow")
+
+
+def measure(page):
+    """One cold sample for ``page``, taken inside this (fresh) interpreter"""
+    sys.path.insert(0, ROOT)
+    import streamlit  # noqa: F401  (loaded by the server before any page)
+    from streamlit.testing.v1 import AppTest
+
+    import views
+
+    before = set(sys.modules)
+    start = time.perf_counter()
+    __import__(views.PAGES[page])
+    import_seconds = time.perf_counter() - start
+    heavy = sorted(name for name in HEAVY if name in sys.modules and name not in before)
+
+    app = AppTest.from_file(APP, default_timeout=300)
+    app.session_state.current_page = page
+    start = time.perf_counter()
+    app.run()
+    first_paint = time.perf_counter() - start
+    start = time.perf_counter()
+    app.run()
+    rerun = time.perf_counter() - start
+    return {
+        "page": page,
+        "import_ms": 1000 * import_seconds,
+        "first_paint_ms": 1000 * first_paint,
+        "rerun_ms": 1000 * rerun,
+        "heavy_imports": heavy,
+        "errors": [str(error.value) for error in app.exception],
+    }
+
+
+def sample(page):
+    """Run ``measure`` in a child interpreter and return its result"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--worker", page],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="cold samples per page (median reported)")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure(args.worker)))
+        return
+
+    # Sessions driven here stay out of the real page-view analytics
+    scratch = tempfile.TemporaryDirectory()
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch.name, "analytics.sqlite3")
+
+    sys.path.insert(0, ROOT)
+    import views
+
+    results = []
+    for page in views.PAGES:
+        runs = [sample(page) for _ in range(args.repeat)]
+        results.append({
+            "page": page,
+            "import_ms": statistics.median(run["import_ms"] for run in runs),
+            "first_paint_ms": statistics.median(run["first_paint_ms"] for run in runs),
+            "rerun_ms": statistics.median(run["rerun_ms"] for run in runs),
+            "heavy_imports": runs[0]["heavy_imports"],
+            "errors": runs[0]["errors"],
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'Page':<12} {'Import (ms)':>12} {'First paint (ms)':>17} {'Rerun (ms)':>11}  Heavy imports")
+    for row in results:
+        print(
+            f"{row['page']:<12} {row['import_ms']:>12.1f} {row['first_paint_ms']:>17.1f} {row['rerun_ms']:>11.1f}  "
+            f"{', '.join(row['heavy_imports']) or '-'}{'  ERROR' if row['errors'] else ''}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Headless latency suite: every page, button and visualizer of both apps
+
+Drives Portfolio101.py and the mirror app ("kareem abd.py") with AppTest
+and records, for every step, the script-run wall time, the number of
+elements sent and their payload size. The mirror app is pointed at a
+local stand-in site, so no network is needed. Sleeps in app code are
+skipped (and totalled) so animations do not swamp the timings.
+
+Results are compared with benchmarks/thresholds.json; any step over its
+limits, or raising an exception, makes the exit status 1. Usage (from the
+repo root):
+
+    python benchmarks/suite.py [--repeat 3] [--json] [--output FILE]
+    python benchmarks/suite.py --update-thresholds
+"""
+import argparse
+import http.server
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PORTFOLIO = os.path.join(ROOT, "Portfolio101.py")
+MIRROR = os.path.join(ROOT, "kareem abd.py")
+THRESHOLDS = os.path.join(ROOT, "benchmarks", "thresholds.json")
+
+# Headroom given to each metric when thresholds are rewritten from a run
+SECONDS_FACTOR = 3.0
+SECONDS_SLACK = 0.5
+SIZE_FACTOR = 1.25
+
+# Visualizers with further modes: visualizer -> (label of the selectbox choosing the mode, other modes)
+VARIANTS = {
+    "Protein Pattern": ("Choose Pattern:", ("Codon Table", "Protein Spiral")),
+}
+
+_SITE = {
+    "/": b'<html><head><link rel="stylesheet" href="/style.css"></head>'
+         b'<body><h1>Front page</h1><img src="/logo.gif"><a href="/story">Story</a></body></html>',
+    "/story": b'<html><head><link rel="stylesheet" href="/style.css"></head><body><p>Story</p></body></html>',
+    "/style.css": b"body { color: #222; }\n/* comment */\nh1 { font-size: 2rem; }",
+    "/logo.gif": b"GIF89a\x01\x00\x01\x00\x00\x00\x00;",
+}
+
+
+class _SiteHandler(http.server.BaseHTTPRequestHandler):
+    """Serves ``_SITE`` as the mirrored upstream"""
+
+    def do_GET(self):
+        body = _SITE.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/css" if self.path.endswith(".css") else "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Recorder:
+    """Times AppTest runs and tallies the messages each one sends"""
+
+    def __init__(self):
+        from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext, get_script_run_ctx
+
+        self.steps = []
+        self._messages = []
+        self._slept = 0.0
+
+        enqueue = ScriptRunContext.enqueue
+        recorder = self
+
+        def recording_enqueue(context, msg):
+            enqueue(context, msg)
+            new_element = msg.WhichOneof("type") == "delta" and msg.delta.WhichOneof("type") == "new_element"
+            recorder._messages.append((new_element, msg.ByteSize()))
+
+        ScriptRunContext.enqueue = recording_enqueue
+
+        # AppTest itself polls with sleep(), so only the script thread's sleeps are skipped
+        sleep = time.sleep
+
+        def skipping_sleep(seconds):
+            if get_script_run_ctx(suppress_warning=True) is None:
+                sleep(seconds)
+            else:
+                recorder._slept += seconds
+
+        time.sleep = skipping_sleep
+
+    def step(self, name, app, action):
+        """Run ``action`` (which reruns ``app``) and record it as ``name``"""
+        self._messages.clear()
+        self._slept = 0.0
+        start = time.perf_counter()
+        action()
+        seconds = time.perf_counter() - start
+        self.steps.append({
+            "step": name,
+            "seconds": seconds,
+            "elements": sum(1 for new_element, _ in self._messages if new_element),
+            "payload_bytes": sum(size for _, size in self._messages),
+            "skipped_sleep_seconds": self._slept,
+            "errors": [str(error.value) for error in app.exception],
+        })
+
+
+def _select(app, label, option):
+    """Pick ``option`` in the selectbox labelled ``label`` (applied on the next run)"""
+    next(box for box in app.selectbox if box.label == label).select(option)
+
+
+def _find_button(app, key, label):
+    for button in app.button:
+        if (button.key, button.label) == (key, label):
+            return button
+    return None
+
+
+def _click_buttons(recorder, app, prefix, seen):
+    """Click every button on screen not clicked before, one run each"""
+    buttons = [(button.key, button.label) for button in app.button if not (button.key or "").startswith("nav_")]
+    for key, label in buttons:
+        if (key, label) in seen:
+            continue
+        seen.add((key, label))
+        button = _find_button(app, key, label)
+        if button is not None:
+            recorder.step(f"{prefix} / {label}", app, lambda: button.click().run())
+
+
+def portfolio(recorder):
+    """Every page, every visualizer and every button of the portfolio"""
+    from streamlit.testing.v1 import AppTest
+
+    import views
+    from views.algorithms import VISUALIZERS
+
+    app = AppTest.from_file(PORTFOLIO, default_timeout=300)
+    recorder.step("Home: first load", app, app.run)
+    seen = set()
+    for page in views.PAGES:
+        recorder.step(f"{page}: open", app, lambda: app.button(key=f"nav_{page}").click().run())
+        recorder.step(f"{page}: rerun", app, app.run)
+        if page == "Algorithms":
+            for label in VISUALIZERS:
+                _select(app, "Choose Algorithm to Visualize:", label)
+                recorder.step(f"Algorithms: {label}", app, app.run)
+                _click_buttons(recorder, app, f"Algorithms: {label}", seen)
+                mode_label, modes = VARIANTS.get(label, (None, ()))
+                for choice in modes:
+                    _select(app, mode_label, choice)
+                    recorder.step(f"Algorithms: {label} ({choice})", app, app.run)
+                    _click_buttons(recorder, app, f"Algorithms: {label} ({choice})", seen)
+        else:
+            _click_buttons(recorder, app, page, seen)
+
+
+def mirror(recorder):
+    """The mirror app against a local stand-in site, cold and warm"""
+    from streamlit.testing.v1 import AppTest
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SiteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    site = f"http://127.0.0.1:{server.server_port}"
+    original_tempdir = tempfile.tempdir
+    try:
+        with tempfile.TemporaryDirectory() as scratch:
+            # Keep the benchmark's disk caches away from the real ones
+            tempfile.tempdir = scratch
+            os.environ["MIRROR_URLS"] = f"{site}/"
+            os.environ["MIRROR_DEPTH"] = "1"
+            app = AppTest.from_file(MIRROR, default_timeout=300)
+            recorder.step("Mirror: first load", app, app.run)
+            recorder.step("Mirror: rerun", app, app.run)
+            # Followed links show up once the prefetcher has crawled the seed
+            deadline = time.time() + 10
+            while len(app.selectbox(key="mirror_page").options) < 2 and time.time() < deadline:
+                time.sleep(0.1)
+                app.run()
+            if len(app.selectbox(key="mirror_page").options) > 1:
+                recorder.step("Mirror: switch page", app, lambda: app.selectbox(key="mirror_page").select_index(1).run())
+    finally:
+        tempfile.tempdir = original_tempdir
+        server.shutdown()
+
+
+def run_suite():
+    """One pass over both apps; a list of step results"""
+    recorder = Recorder()
+    with tempfile.TemporaryDirectory() as scratch:
+        # Page views recorded by the benchmark stay out of the real analytics
+        os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch, "analytics.sqlite3")
+        portfolio(recorder)
+    mirror(recorder)
+    return recorder.steps
+
+
+def combine(passes):
+    """Median of each metric over repeated passes, step by step"""
+    combined = []
+    for runs in zip(*passes):
+        row = dict(runs[0])
+        for metric in ("seconds", "elements", "payload_bytes", "skipped_sleep_seconds"):
+            row[metric] = statistics.median(run[metric] for run in runs)
+        row["errors"] = sorted({error for run in runs for error in run["errors"]})
+        combined.append(row)
+    return combined
+
+
+def regressions(steps, thresholds):
+    """Steps over their thresholds or raising; new steps are not regressions"""
+    found = []
+    for row in steps:
+        if row["errors"]:
+            found.append({"step": row["step"], "metric": "errors", "value": row["errors"], "limit": []})
+        for metric, limit in thresholds.get(row["step"], {}).items():
+            if row[metric] > limit:
+                found.append({"step": row["step"], "metric": metric, "value": row[metric], "limit": limit})
+    return found
+
+
+def new_thresholds(steps):
+    """Limits with headroom over the measured values"""
+    return {
+        row["step"]: {
+            "seconds": round(max(row["seconds"] * SECONDS_FACTOR, row["seconds"] + SECONDS_SLACK), 2),
+            "elements": int(row["elements"] * SIZE_FACTOR) + 1,
+            "payload_bytes": int(row["payload_bytes"] * SIZE_FACTOR) + 1,
+        }
+        for row in steps
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=1, help="passes over both apps (median reported)")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    parser.add_argument("--thresholds", default=THRESHOLDS, help="JSON file of per-step limits")
+    parser.add_argument("--update-thresholds", action="store_true", help="rewrite the limits from this run")
+    args = parser.parse_args()
+
+    # .streamlit/config.toml is read from the working directory
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    steps = combine([run_suite() for _ in range(args.repeat)])
+
+    if args.update_thresholds:
+        with open(args.thresholds, "w", encoding="utf-8") as f:
+            json.dump(new_thresholds(steps), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    thresholds = {}
+    if os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding="utf-8") as f:
+            thresholds = json.load(f)
+    found = regressions(steps, thresholds)
+
+    report = {"steps": steps, "regressions": found}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"{'Step':<58} {'Time (ms)':>10} {'Elements':>9} {'Payload (KB)':>13}")
+        for row in steps:
+            print(f"{row['step'][:58]:<58} {1000 * row['seconds']:>10.1f} {row['elements']:>9.0f} "
+                  f"{row['payload_bytes'] / 1024:>13.1f}{'  ERROR' if row['errors'] else ''}")
+        for regression in found:
+            print(f"REGRESSION {regression['step']}: {regression['metric']} {regression['value']} > {regression['limit']}")
+    sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
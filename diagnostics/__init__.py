@@ -0,0 +1 @@
+"""Hot-path timing and profiling shared by both apps."""
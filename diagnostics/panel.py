@@ -0,0 +1,100 @@
+"""Hidden diagnostics sidebar, shown only with ?diagnostics=1 in the URL"""
+import contextlib
+import cProfile
+import io
+import marshal
+import pstats
+import time
+import tracemalloc
+
+import streamlit as st
+
+from diagnostics.timings import STORE
+
+QUERY_PARAM = "diagnostics"
+
+# Frames kept per allocation while tracing, and rows in the text reports
+TRACE_FRAMES = 10
+REPORT_ROWS = 40
+
+
+def enabled():
+    """Whether this session asked for the diagnostics panel"""
+    return st.query_params.get(QUERY_PARAM) == "1"
+
+
+def _request_capture():
+    st.session_state.diagnostics_capture = True
+
+
+def profile_report(profiler, snapshot):
+    """Downloadable cProfile stats plus text summaries of time and memory"""
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    stats.sort_stats("cumulative").print_stats(REPORT_ROWS)
+    memory = io.StringIO()
+    top = snapshot.statistics("lineno")
+    memory.write(f"{sum(stat.size for stat in top) / 1024:,.1f} KiB allocated and still held at the end of the rerun\n\n")
+    for stat in top[:REPORT_ROWS]:
+        memory.write(f"{stat}\n")
+    return {
+        "captured_at": time.strftime("%Y%m%d-%H%M%S"),
+        # marshal of the stats dict is what pstats.Stats / snakeviz load
+        "prof": marshal.dumps(stats.stats),
+        "time": stats.stream.getvalue(),
+        "memory": memory.getvalue(),
+    }
+
+
+@contextlib.contextmanager
+def capture():
+    """Profile the enclosed rerun with cProfile and tracemalloc if one was requested"""
+    if not (enabled() and st.session_state.pop("diagnostics_capture", False)):
+        yield
+        return
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+        st.session_state.diagnostics_profile = profile_report(profiler, snapshot)
+
+
+def sidebar_panel(profiling=True):
+    """Per-function latency percentiles and, with ``profiling``, one-rerun captures"""
+    if not enabled():
+        return
+    with st.sidebar.expander("🩺 Diagnostics", expanded=True):
+        rows = STORE.summary()
+        if not rows:
+            st.caption("No instrumented calls yet")
+            return
+        st.dataframe(rows, width="stretch", hide_index=True)
+        name = st.selectbox("Latency histogram:", [row["Function"] for row in rows], key="diagnostics_function")
+        histogram = [{"Latency": label, "Calls": calls} for label, calls in STORE.histogram(name) if calls]
+        st.bar_chart(histogram, x="Latency", y="Calls", sort=False, height=200)
+        st.button("Reset timings", on_click=STORE.reset, key="diagnostics_reset")
+
+        if not profiling:
+            return
+        # The click's own rerun is the one profiled: callbacks run before the script
+        st.button("⏱️ Profile a rerun", on_click=_request_capture, key="diagnostics_profile_run")
+        report = st.session_state.get("diagnostics_profile")
+        if report is not None:
+            st.caption(f"Captured {report['captured_at']}")
+            st.download_button(
+                "cProfile stats (.prof)", report["prof"], file_name=f"rerun-{report['captured_at']}.prof",
+                mime="application/octet-stream", on_click="ignore", key="diagnostics_prof",
+            )
+            st.download_button(
+                "Time and memory report (.txt)", report["time"] + "\n" + report["memory"],
+                file_name=f"rerun-{report['captured_at']}.txt", mime="text/plain", on_click="ignore",
+                key="diagnostics_report",
+            )
+            st.code(report["memory"][:4000], language=None)
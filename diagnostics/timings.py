@@ -0,0 +1,114 @@
+"""Process-wide latency histograms for instrumented functions"""
+import bisect
+import contextlib
+import functools
+import threading
+import time
+from collections import deque
+
+# Recent durations kept per function for percentiles
+SAMPLES = 2048
+
+# Histogram bucket upper bounds in milliseconds; slower calls land in a final open bucket
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted, non-empty sequence"""
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+class Timings:
+    """Call durations per name, shared by every session in the process
+
+    Every call is counted into a fixed log-scale histogram along with the
+    call count, total and maximum; only the last ``samples`` durations are
+    kept, so percentiles follow recent behaviour and memory stays bounded.
+    """
+
+    def __init__(self, samples=SAMPLES):
+        self.samples = samples
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def record(self, name, seconds):
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = {
+                    "calls": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "recent": deque(maxlen=self.samples),
+                    "histogram": [0] * (len(BUCKETS_MS) + 1),
+                }
+            series["calls"] += 1
+            series["total"] += seconds
+            series["max"] = max(series["max"], seconds)
+            series["recent"].append(seconds)
+            series["histogram"][bisect.bisect_left(BUCKETS_MS, 1000 * seconds)] += 1
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def names(self):
+        with self._lock:
+            return sorted(self._series)
+
+    def summary(self):
+        """One row per function, the largest total time first"""
+        with self._lock:
+            series = {name: (dict(values), sorted(values["recent"])) for name, values in self._series.items()}
+        rows = []
+        for name, (values, ordered) in series.items():
+            rows.append({
+                "Function": name,
+                "Calls": values["calls"],
+                "p50 (ms)": round(1000 * percentile(ordered, 0.50), 2),
+                "p95 (ms)": round(1000 * percentile(ordered, 0.95), 2),
+                "p99 (ms)": round(1000 * percentile(ordered, 0.99), 2),
+                "Max (ms)": round(1000 * values["max"], 2),
+                "Total (s)": round(values["total"], 3),
+            })
+        rows.sort(key=lambda row: row["Total (s)"], reverse=True)
+        return rows
+
+    def histogram(self, name):
+        """``(bucket label, calls)`` pairs for ``name``, fastest bucket first"""
+        with self._lock:
+            counts = list(self._series[name]["histogram"])
+        labels = [f"≤ {bound:g} ms" for bound in BUCKETS_MS] + [f"> {BUCKETS_MS[-1]:g} ms"]
+        return list(zip(labels, counts))
+
+
+STORE = Timings()
+
+
+@contextlib.contextmanager
+def timer(name, store=None):
+    """Record how long the ``with`` block takes under ``name``"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        (store or STORE).record(name, time.perf_counter() - start)
+
+
+def timed(function=None, name=None):
+    """Decorator recording every call's duration, under the function's dotted name by default
+
+    Calls that raise (including Streamlit's rerun and stop signals) are
+    recorded too.
+    """
+    def decorate(function):
+        label = name or f"{function.__module__}.{function.__qualname__}"
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with timer(label):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorate(function) if function is not None else decorate
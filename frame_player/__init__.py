@@ -0,0 +1,77 @@
+"""Browser-side playback for precomputed algorithm animations
+
+The visualizers compute every frame once on the server and hand them to this
+component in a single payload; play, pause and scrubbing then happen entirely
+in the browser without further script reruns.
+"""
+import base64
+import os
+
+import numpy as np
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
+_component = components.declare_component("frame_player", path=_FRONTEND_DIR)
+
+# Typed-array names understood by the frontend
+_DTYPES = {
+    np.dtype(np.int32): "int32",
+    np.dtype(np.float64): "float64",
+}
+
+# Largest integer a float64 (and so a JavaScript number) holds exactly
+_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _typed(array):
+    """``array`` as int32 when it fits, else float64 if that is still exact"""
+    if array.dtype.kind == "f":
+        return array.astype(np.float64)
+    if array.dtype.kind not in "iub":
+        raise ValueError(f"Frame data must be numeric, not {array.dtype}")
+    if not array.size:
+        return array.astype(np.int32)
+    low, high = int(array.min()), int(array.max())
+    info = np.iinfo(np.int32)
+    if info.min <= low and high <= info.max:
+        return array.astype(np.int32)
+    if -_EXACT_FLOAT_INT <= low and high <= _EXACT_FLOAT_INT:
+        return array.astype(np.float64)
+    raise ValueError("Frame data has integers too large to send exactly (beyond 2**53)")
+
+
+def build_payload(kind, data, steps, interval_ms=100, title="", labels=None):
+    """Pack frames into a compact JSON-safe payload
+
+    ``kind`` selects how the frontend reads ``data``:
+
+    - ``"bars"``: ``data`` is ``(n_frames, n_bars)``; frame ``t`` draws row ``t``
+    - ``"grid"``: ``data`` is a 2-D matrix of reveal orders; frame ``t`` shows
+      cells whose value is ``<= steps[t]``
+    - ``"line"``: ``data`` is 1-D; frame ``t`` draws the first ``steps[t]`` values
+
+    Integers go as int32 when they all fit and as float64 otherwise;
+    integers float64 cannot hold exactly raise ``ValueError``.
+    """
+    if kind not in ("bars", "grid", "line"):
+        raise ValueError(f"Unknown frame player kind: {kind}")
+
+    array = _typed(np.asarray(data))
+    array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+
+    return {
+        "kind": kind,
+        "dtype": _DTYPES[np.dtype(array.dtype.type)],
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.tobytes()).decode("ascii"),
+        "steps": [int(step) for step in steps],
+        "interval": int(interval_ms),
+        "title": title,
+        "labels": list(labels) if labels is not None else None,
+    }
+
+
+def frame_player(kind, data, steps, interval_ms=100, title="", labels=None, height=420, key=None):
+    """Render an animation that plays, pauses and scrubs client-side"""
+    payload = build_payload(kind, data, steps, interval_ms=interval_ms, title=title, labels=labels)
+    return _component(payload=payload, height=height, key=key, default=None)
@@ -1,5 +1,10 @@
 import streamlit as st
-import requests
+import os
+import tempfile
+
+from diagnostics import panel
+from diagnostics.timings import timed
+from mirror import inline, pages, prefetch, store
 
 # Configure the page
 st.set_page_config(
@@ -8,31 +13,88 @@ st.set_page_config(
     layout="wide"
 )
 
-# The website you want to mirror
-WEBSITE_URL = "https://slash-news.com/4243/"  # Replace with your target website
+# The websites you want to mirror (a comma-separated MIRROR_URLS overrides the default)
+WEBSITE_URLS = [
+    url.strip() for url in os.environ.get("MIRROR_URLS", "https://slash-news.com/4243/").split(",") if url.strip()
+]
+
+# Same-site links followed from those pages, the cap on mirrored pages and how often each is refreshed
+FOLLOW_DEPTH = int(os.environ.get("MIRROR_DEPTH", "1"))
+MAX_PAGES = 30
+REFRESH_INTERVAL = 240
+
+# Upstream bodies are streamed and cut at this size before caching or embedding
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# Compressed page copies shared by every app process on this host
+PAGE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "mirror-pages")
+PAGE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Stylesheets, scripts and images inlined into the mirrored page, cached per URL
+ASSET_CACHE_DIR = os.path.join(tempfile.gettempdir(), "mirror-assets")
+ASSET_CACHE_BYTES = 256 * 1024 * 1024
+
+@st.cache_resource
+def get_page_cache():
+    """One page cache, asset inliner and keep-alive session shared by every visitor"""
+    session = pages.make_session()
+    inliner = inline.Inliner(session, store=store.DiskCache(ASSET_CACHE_DIR, ASSET_CACHE_BYTES))
+    return pages.PageCache(
+        ttl=300,
+        timeout=10,
+        session=session,
+        store=store.DiskCache(PAGE_CACHE_DIR, PAGE_CACHE_BYTES),
+        transform=inliner.inline,
+        max_bytes=MAX_PAGE_BYTES,
+    )
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_resource
+def get_prefetcher():
+    """Background scheduler keeping every mirrored page fresh in the shared cache"""
+    return prefetch.Prefetcher(
+        get_page_cache(),
+        WEBSITE_URLS,
+        depth=FOLLOW_DEPTH,
+        interval=REFRESH_INTERVAL,
+        per_host=2,
+        max_pages=MAX_PAGES,
+    ).start()
+
+@timed
 def fetch_website(url):
-    """Fetch website content"""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        return response.text
-    except Exception as e:
-        return f"<h1>Error loading website</h1><p>{str(e)}</p>"
+    """Fetch website content: the last good self-contained copy, revalidated in the background"""
+    page = get_page_cache().get(url)
+    return page.text if page.text is not None else page.error_html()
 
 # Main app
 #st.title("🌐 Website Mirror")
 
+prefetcher = get_prefetcher()
+mirrored = prefetcher.urls()
+if not mirrored:
+    st.error("❌ No websites to mirror: set MIRROR_URLS to one or more comma-separated URLs")
+    st.stop()
+requested = st.query_params.get("page")
+current = st.selectbox(
+    "Page:",
+    mirrored,
+    index=mirrored.index(requested) if requested in mirrored else 0,
+    key="mirror_page",
+)
+st.query_params["page"] = current
+
 # Fetch and display the website
 with st.spinner("Loading website..."):
-    website_content = fetch_website(WEBSITE_URL)
+    website_content = fetch_website(current)
 
 # Display the mirrored content
 st.components.v1.html(website_content, height=800, scrolling=True)
 
 # Optional: Show the source URL
-st.info(f"Mirroring content from: {WEBSITE_URL}")
+st.info(f"Mirroring content from: {current}")
+
+with st.expander("📈 Cache freshness and fetch latency"):
+    st.dataframe(prefetcher.stats(), width="stretch", hide_index=True)
+
+# ?diagnostics=1 adds a sidebar with fetch timings
+panel.sidebar_panel(profiling=False)
@@ -0,0 +1 @@
+"""Static media preparation for the portfolio pages."""
@@ -0,0 +1,72 @@
+"""Display-sized, disk-cached image variants (1x and 2x for HiDPI screens)"""
+import hashlib
+import os
+import tempfile
+from io import BytesIO
+
+from PIL import Image, ImageOps, features
+
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "portfolio-images")
+
+# WebP when this Pillow build can encode it, JPEG otherwise
+FORMAT = "WEBP" if features.check("webp") else "JPEG"
+EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg"}
+
+
+def content_hash(path, block_size=1024 * 1024):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encode(image, image_format, quality):
+    buffer = BytesIO()
+    if image_format == "JPEG":
+        image.convert("RGB").save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(buffer, image_format, quality=quality, method=4)
+    return buffer.getvalue()
+
+
+def display_variants(path, width, scales=(1, 2), cache_dir=CACHE_DIR, image_format=FORMAT, quality=82):
+    """``{scale: encoded bytes}`` of ``path`` resized to ``width * scale`` pixels wide
+
+    Variants are cached on disk under the source's content hash, so every
+    process (and every restart) reuses them. The source is decoded at most
+    once per call, and only if some variant is missing. Images are never
+    upscaled; EXIF orientation is applied before resizing.
+    """
+    digest = content_hash(path)
+    extension = EXTENSIONS[image_format]
+    targets = {scale: os.path.join(cache_dir, f"{digest}-{width}w@{scale}x.{extension}") for scale in scales}
+
+    variants = {}
+    for scale, target in targets.items():
+        if os.path.exists(target):
+            with open(target, "rb") as f:
+                variants[scale] = f.read()
+    missing = [scale for scale in scales if scale not in variants]
+    if not missing:
+        return variants
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with Image.open(path) as source:
+        # Let the JPEG decoder downscale by a power of two while decoding
+        largest = width * max(missing)
+        source.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+        for scale in missing:
+            size = min(width * scale, image.width)
+            resized = image.resize((size, max(1, round(image.height * size / image.width))), Image.LANCZOS)
+            data = _encode(resized, image_format, quality)
+            partial = f"{targets[scale]}.{os.getpid()}.part"
+            with open(partial, "wb") as f:
+                f.write(data)
+            os.replace(partial, targets[scale])
+            variants[scale] = data
+    return variants
@@ -0,0 +1 @@
+"""Fetching and caching behind the website mirror app."""
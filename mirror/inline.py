@@ -0,0 +1,186 @@
+"""Turn a fetched page into a self-contained document with its assets inlined"""
+import base64
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+from bs4.element import Script, Stylesheet
+
+from mirror.pages import ResponseTooLarge, read_bytes
+
+# Assets larger than this stay as absolute links instead of being inlined
+MAX_INLINE_BYTES = 512 * 1024
+
+# Attributes rewritten to absolute URLs when their asset is not inlined
+_LINK_ATTRIBUTES = {"a": "href", "link": "href", "script": "src", "img": "src", "source": "src", "iframe": "src", "form": "action"}
+
+# Quoted strings (with escapes) and comments; comments are matched so quotes inside them are ignored
+_CSS_STRING = re.compile(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|/\*.*?\*/""", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,])\s*")
+_CSS_URL = re.compile(r"""url\(\s*(['"]?)(.*?)\1\s*\)""")
+_CSS_IMPORT = re.compile(r"""@import\s+(['"])(.*?)\1""")
+# One srcset candidate: a URL (no whitespace, not ending in a comma) and an optional descriptor
+_SRCSET_CANDIDATE = re.compile(r"[\s,]*([^\s,][^\s]*?),*(?=\s|$)([^,]*)")
+_CLOSING_SCRIPT = re.compile(r"</(script)", re.I)
+_CLOSING_STYLE = re.compile(r"</(style)", re.I)
+
+
+def minify_css(css):
+    """Drop comments and whitespace around CSS punctuation, leaving quoted strings intact"""
+    parts = []
+    for index, part in enumerate(_CSS_STRING.split(css)):
+        if index % 2:
+            # A string literal is kept byte for byte; a comment (None) is dropped
+            parts.append(part or "")
+            continue
+        part = _CSS_SPACE.sub(" ", part)
+        parts.append(_CSS_PUNCTUATION.sub(r"\1", part))
+    return "".join(parts).strip()
+
+
+def absolutize_css(css, base_url):
+    """Resolve ``url(...)`` and ``@import`` references against the stylesheet's URL"""
+    def resolve(match):
+        target = match.group(2)
+        if target.startswith(("data:", "#")):
+            return match.group(0)
+        return f'url("{urljoin(base_url, target)}")'
+
+    css = _CSS_URL.sub(resolve, css)
+    return _CSS_IMPORT.sub(lambda match: f'@import "{urljoin(base_url, match.group(2))}"', css)
+
+
+def absolutize_srcset(srcset, base_url):
+    """Resolve every candidate URL of a ``srcset`` attribute against ``base_url``"""
+    candidates = []
+    for match in _SRCSET_CANDIDATE.finditer(srcset):
+        target, descriptor = match.group(1), match.group(2).strip()
+        if not target.startswith("data:"):
+            target = urljoin(base_url, target)
+        candidates.append(f"{target} {descriptor}" if descriptor else target)
+    return ", ".join(candidates)
+
+
+class Inliner:
+    """Inline stylesheets, scripts and images of a page into one document
+
+    Each page is parsed once with lxml. Its assets are fetched in parallel
+    on a bounded thread pool through the shared session. Every asset is
+    cached by URL in ``store`` (a ``mirror.store.DiskCache``) for
+    ``max_age`` seconds, so re-inlining a page after an upstream change
+    only downloads assets that are new. Stylesheets are minified and their
+    references made absolute. Scripts are inlined verbatim (except
+    ``defer``/``async`` ones, which must stay external to run when they
+    expect), and images become data URIs. Anything missing or too large keeps an absolute URL.
+    """
+
+    def __init__(self, session, store=None, workers=8, timeout=10, max_age=24 * 3600, max_bytes=MAX_INLINE_BYTES):
+        self.session = session
+        self.store = store
+        self.timeout = timeout
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.last_stats = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-fetch")
+        self._stats_lock = threading.Lock()
+
+    def fetch_asset(self, url, stats):
+        """``(content type, bytes)`` for ``url``, or None if unavailable or too large
+
+        Bodies are streamed and dropped as soon as they pass ``max_bytes``.
+        """
+        key = f"asset:{url}"
+        cached = self.store.get(key) if self.store is not None else None
+        if cached is not None and time.time() - cached[0]["fetched_at"] < self.max_age:
+            with self._stats_lock:
+                stats["cache_hits"] += 1
+            return cached[0]["content_type"], cached[1]
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip()
+                content = read_bytes(response, self.max_bytes)
+        except ResponseTooLarge:
+            # Too big to inline: the tag keeps an absolute URL
+            with self._stats_lock:
+                stats["too_large"] += 1
+            return None
+        except Exception:
+            with self._stats_lock:
+                stats["failed"] += 1
+            # A stale copy beats no copy
+            return (cached[0]["content_type"], cached[1]) if cached is not None else None
+        with self._stats_lock:
+            stats["fetched"] += 1
+            stats["bytes_fetched"] += len(content)
+        if self.store is not None:
+            try:
+                self.store.put(key, content, content_type=content_type, fetched_at=time.time())
+            except OSError:
+                pass
+        return content_type, content
+
+    def inline(self, url, html):
+        """Self-contained version of ``html`` fetched from ``url``"""
+        start = time.perf_counter()
+        stats = {"assets": 0, "cache_hits": 0, "fetched": 0, "failed": 0, "too_large": 0, "bytes_fetched": 0}
+        soup = BeautifulSoup(html, "lxml")
+
+        stylesheets = [
+            tag for tag in soup.find_all("link", href=True)
+            if "stylesheet" in [rel.lower() for rel in tag.get("rel", [])]
+        ]
+        # Browsers ignore defer/async on inline scripts, so those stay external to keep their timing
+        scripts = [
+            tag for tag in soup.find_all("script", src=True)
+            if not (tag.has_attr("defer") or tag.has_attr("async"))
+        ]
+        images = [tag for tag in soup.find_all("img", src=True) if not tag["src"].startswith("data:")]
+        targets = [(tag, urljoin(url, tag["href" if tag.name == "link" else "src"])) for tag in stylesheets + scripts + images]
+
+        # One request per distinct asset URL, all in flight together
+        unique = list(dict.fromkeys(asset_url for _, asset_url in targets))
+        stats["assets"] = len(unique)
+        fetched = dict(zip(unique, self._executor.map(lambda asset_url: self.fetch_asset(asset_url, stats), unique)))
+
+        for tag, asset_url in targets:
+            asset = fetched[asset_url]
+            if asset is None:
+                continue
+            content_type, content = asset
+            if tag.name == "link":
+                css = absolutize_css(minify_css(content.decode("utf-8", "replace")), asset_url)
+                style = soup.new_tag("style")
+                if tag.get("media"):
+                    style["media"] = tag["media"]
+                style.append(Stylesheet(_CLOSING_STYLE.sub(r"<\\/\1", css)))
+                tag.replace_with(style)
+            elif tag.name == "script":
+                del tag["src"]
+                tag.clear()
+                tag.append(Script(_CLOSING_SCRIPT.sub(r"<\\/\1", content.decode("utf-8", "replace"))))
+            else:
+                tag["src"] = f"data:{content_type};base64,{base64.b64encode(content).decode('ascii')}"
+                if tag.get("srcset"):
+                    del tag["srcset"]
+
+        # Whatever was not inlined must not resolve against the iframe's about:srcdoc
+        for name, attribute in _LINK_ATTRIBUTES.items():
+            for tag in soup.find_all(name, attrs={attribute: True}):
+                if not tag[attribute].startswith(("data:", "#", "javascript:", "mailto:")):
+                    tag[attribute] = urljoin(url, tag[attribute])
+        for tag in soup.find_all(["img", "source"], srcset=True):
+            tag["srcset"] = absolutize_srcset(tag["srcset"], url)
+        for tag in soup.find_all("style"):
+            if tag.string:
+                tag.string.replace_with(Stylesheet(absolutize_css(minify_css(tag.string), url)))
+
+        document = str(soup)
+        stats["bytes_out"] = len(document.encode("utf-8"))
+        stats["seconds"] = time.perf_counter() - start
+        self.last_stats = stats
+        return document
@@ -0,0 +1,337 @@
+"""Stale-while-revalidate page cache over a pooled, keep-alive HTTP session"""
+import codecs
+import re
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Largest page body kept by default; bigger bodies are truncated (or refused)
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# Bytes pulled from the socket per read while streaming a body
+READ_CHUNK = 64 * 1024
+
+_HEADER_CHARSET = re.compile(r"""charset=["']?([\w.:-]+)""", re.I)
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.I)
+
+
+class ResponseTooLarge(Exception):
+    """Raised when a body exceeds its byte cap and truncation is not allowed"""
+
+
+def _charset(response, head):
+    """Charset from the Content-Type header, else a <meta> tag in ``head``, else UTF-8"""
+    found = _HEADER_CHARSET.search(response.headers.get("Content-Type", ""))
+    if found is None:
+        found = _META_CHARSET.search(head)
+    name = found.group(1) if found else "utf-8"
+    name = name.decode("ascii", "replace") if isinstance(name, bytes) else name
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return "utf-8"
+
+
+def read_text(response, max_bytes=MAX_PAGE_BYTES, truncate=True, chunk_size=READ_CHUNK):
+    """Stream and decode a body without ever holding more than ``max_bytes`` of it
+
+    Chunks from ``iter_content`` (already un-gzipped, so compressed bombs
+    are capped too) go through an incremental decoder, so multi-byte
+    characters split across chunks decode correctly. At the cap the body is
+    cut and the connection dropped; with ``truncate=False`` that raises
+    ``ResponseTooLarge`` instead. A Content-Length already over the cap
+    fails before any of the body is read. Returns ``(text, stats)``, where
+    stats holds the bytes read, whether the body was truncated and the peak
+    bytes held by the fetch buffers.
+    """
+    declared = response.headers.get("Content-Length")
+    if not truncate and declared and declared.isdigit() and int(declared) > max_bytes:
+        response.close()
+        raise ResponseTooLarge(f"Response of {int(declared):,} bytes exceeds the {max_bytes:,} byte cap")
+
+    decoder = None
+    pieces = []
+    held = received = peak = 0
+    truncated = False
+    for chunk in response.iter_content(chunk_size):
+        if received + len(chunk) > max_bytes:
+            if not truncate:
+                response.close()
+                raise ResponseTooLarge(f"Response exceeds the {max_bytes:,} byte cap")
+            chunk = chunk[:max_bytes - received]
+            truncated = True
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(_charset(response, chunk[:2048]))(errors="replace")
+        received += len(chunk)
+        piece = decoder.decode(chunk)
+        pieces.append(piece)
+        held += sys.getsizeof(piece)
+        peak = max(peak, held + len(chunk))
+        if truncated:
+            response.close()
+            break
+    if decoder is not None:
+        pieces.append(decoder.decode(b"", final=True))
+
+    text = "".join(pieces)
+    # Joining briefly holds both the pieces and the final string
+    peak = max(peak, held + sys.getsizeof(text))
+    return text, {"bytes": received, "truncated": truncated, "peak_bytes": peak}
+
+
+def read_bytes(response, max_bytes, chunk_size=READ_CHUNK):
+    """Stream a binary body, raising ``ResponseTooLarge`` past ``max_bytes``"""
+    declared = response.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        response.close()
+        raise ResponseTooLarge(f"Response of {int(declared):,} bytes exceeds the {max_bytes:,} byte cap")
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size):
+        if len(body) + len(chunk) > max_bytes:
+            response.close()
+            raise ResponseTooLarge(f"Response exceeds the {max_bytes:,} byte cap")
+        body += chunk
+    return bytes(body)
+
+
+class Page:
+    """Last known good copy of a URL plus its revalidation state"""
+
+    def __init__(self, url):
+        self.url = url
+        self.text = None
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = None
+        self.checked_at = None
+        self.error = None
+        self.failed_at = None
+        self.loading = threading.Lock()
+        # Counters for tuning refresh intervals
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.failures = 0
+        self.latencies = deque(maxlen=20)
+        self.body_bytes = None
+        self.peak_bytes = None
+        self.truncated = False
+
+    def error_html(self):
+        """Error page shown when no good copy exists yet"""
+        return f"<h1>Error loading website</h1><p>{self.error}</p>"
+
+    def stats(self, now=None):
+        """Freshness and upstream latency summary"""
+        now = time.time() if now is None else now
+        return {
+            "URL": self.url,
+            "Age (s)": None if self.checked_at is None else round(now - self.checked_at, 1),
+            "Last fetch (ms)": round(1000 * self.latencies[-1]) if self.latencies else None,
+            "Mean fetch (ms)": round(1000 * sum(self.latencies) / len(self.latencies)) if self.latencies else None,
+            "Fetches": self.fetches,
+            "Failures in a row": self.failures,
+            "Body (KB)": None if self.body_bytes is None else round(self.body_bytes / 1024, 1),
+            "Peak fetch memory (KB)": None if self.peak_bytes is None else round(self.peak_bytes / 1024, 1),
+            "Truncated": self.truncated,
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "Error": self.error or "",
+        }
+
+
+def make_session(pool_size=10, headers=None):
+    """``requests.Session`` whose connections are kept alive and reused"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, **(headers or {})})
+    return session
+
+
+class PageCache:
+    """Serve the last good copy immediately and revalidate it in the background
+
+    A page older than ``ttl`` seconds is still returned at once, while a
+    worker thread re-requests it with ``If-None-Match`` /
+    ``If-Modified-Since``; a 304 only refreshes the timestamp. Failed
+    requests and non-2xx responses never replace a good copy. Only a URL
+    with no good copy yet is fetched in the caller's thread, and after a
+    failure that fetch is retried at most every ``retry_after`` seconds.
+
+    With a ``store`` (``mirror.store.DiskCache``) good copies are also kept
+    on disk: a process that has never seen a URL (e.g. right after a
+    restart) serves the stored copy instead of waiting on upstream, and a
+    refresh adopts a copy another process revalidated within ``ttl``.
+
+    Bodies are streamed through ``read_text`` and capped at ``max_bytes``:
+    cut there when ``truncate`` is set, otherwise refused like any other
+    failed fetch.
+
+    ``transform(url, text)``, if given, post-processes every new good copy
+    (e.g. ``mirror.inline.Inliner.inline``) before it is cached, so the work
+    happens once per upstream change rather than once per viewer.
+    """
+
+    def __init__(self, ttl=300, timeout=10, retry_after=30, session=None, workers=4, store=None, transform=None,
+                 max_bytes=MAX_PAGE_BYTES, truncate=True):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.session = session or make_session(pool_size=workers)
+        self.store = store
+        self.transform = transform
+        self.max_bytes = max_bytes
+        self.truncate = truncate
+        self._pages = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="page-refresh")
+
+    def get(self, url):
+        """``Page`` for ``url``; ``page.text`` is None if no good copy exists yet"""
+        with self._lock:
+            page = self._pages.setdefault(url, Page(url))
+            if page.text is not None:
+                page.hits += 1
+                self._refresh_if_stale(page)
+                return page
+            page.misses += 1
+        # Concurrent first visitors share one request instead of each fetching
+        with page.loading:
+            retry = page.failed_at is None or time.time() - page.failed_at >= self.retry_after
+            if page.text is None and not self._load(page) and retry:
+                self._revalidate(page)
+        with self._lock:
+            if page.text is not None:
+                self._refresh_if_stale(page)
+        return page
+
+    def page(self, url):
+        """Tracked ``Page`` for ``url`` without fetching anything"""
+        with self._lock:
+            return self._pages.setdefault(url, Page(url))
+
+    def refresh(self, url, max_age=0):
+        """Revalidate ``url`` now unless some process checked it within ``max_age``"""
+        page = self.page(url)
+        with page.loading:
+            self._load(page)
+            if page.checked_at is None or time.time() - page.checked_at >= max_age:
+                self._revalidate(page)
+        return page
+
+    def _refresh_if_stale(self, page):
+        """Queue a background revalidation; the caller holds ``_lock``"""
+        if time.time() - page.checked_at >= self.ttl and page.url not in self._refreshing:
+            self._refreshing.add(page.url)
+            self._executor.submit(self._refresh, page)
+
+    def _load(self, page):
+        """Adopt the stored copy if it is newer than ``page``'s; True if adopted"""
+        stored = self.store.get(page.url) if self.store is not None else None
+        if stored is None:
+            return False
+        metadata, payload = stored
+        with self._lock:
+            if page.fetched_at is not None and metadata["fetched_at"] <= page.fetched_at:
+                return False
+            page.text = payload.decode("utf-8")
+            page.etag = metadata.get("etag")
+            page.last_modified = metadata.get("last_modified")
+            page.fetched_at = metadata["fetched_at"]
+            page.checked_at = metadata["checked_at"]
+        return True
+
+    def _save(self, page):
+        if self.store is None:
+            return
+        try:
+            self.store.put(
+                page.url,
+                page.text.encode("utf-8"),
+                etag=page.etag,
+                last_modified=page.last_modified,
+                fetched_at=page.fetched_at,
+                checked_at=page.checked_at,
+            )
+        except OSError:
+            # A full or read-only disk must not break serving from memory
+            pass
+
+    def _refresh(self, page):
+        try:
+            # Same guard as refresh(): one fetch and save of a URL at a time
+            with page.loading:
+                self._load(page)
+                # Fresh if another process stored a recent check, or refresh() just ran
+                if time.time() - page.checked_at < self.ttl:
+                    return
+                self._revalidate(page)
+        finally:
+            with self._lock:
+                self._refreshing.discard(page.url)
+
+    def _revalidate(self, page):
+        """Conditional GET; updates ``page`` only with a good response"""
+        headers = {}
+        if page.text is not None:
+            if page.etag:
+                headers["If-None-Match"] = page.etag
+            if page.last_modified:
+                headers["If-Modified-Since"] = page.last_modified
+        start = time.perf_counter()
+        body = None
+        try:
+            with self.session.get(page.url, headers=headers, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 304 and page.text is not None:
+                    text = None
+                else:
+                    response.raise_for_status()
+                    if response.status_code != 200:
+                        raise requests.HTTPError(f"Unexpected status {response.status_code}", response=response)
+                    text, body = read_text(response, self.max_bytes, self.truncate)
+            latency = time.perf_counter() - start
+            if text is not None and self.transform is not None:
+                try:
+                    text = self.transform(page.url, text)
+                except Exception:
+                    # The raw page is still better than an error page
+                    pass
+        except Exception as e:
+            with self._lock:
+                page.error = str(e)
+                page.failed_at = time.time()
+                page.fetches += 1
+                page.failures += 1
+                page.latencies.append(time.perf_counter() - start)
+                if page.text is not None:
+                    # Keep serving the good copy; try again after another ttl
+                    page.checked_at = page.failed_at
+            return
+
+        with self._lock:
+            now = time.time()
+            if text is not None:
+                page.text = text
+                page.etag = response.headers.get("ETag")
+                page.last_modified = response.headers.get("Last-Modified")
+                page.fetched_at = now
+                page.body_bytes = body["bytes"]
+                page.peak_bytes = body["peak_bytes"]
+                page.truncated = body["truncated"]
+            page.checked_at = now
+            page.error = None
+            page.failed_at = None
+            page.fetches += 1
+            page.failures = 0
+            page.latencies.append(latency)
+        self._save(page)
@@ -0,0 +1,148 @@
+"""Scheduled, host-limited prefetching of every mirrored page"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Links that point at files rather than pages
+_SKIPPED_SUFFIXES = (".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".pdf", ".zip", ".mp3", ".mp4", ".css", ".js", ".xml")
+
+
+class Target:
+    """Scheduling state of one mirrored URL"""
+
+    def __init__(self, url, depth):
+        self.url = url
+        self.depth = depth
+        self.due = 0.0
+        self.in_flight = False
+
+
+def same_site_links(html, url):
+    """Absolute, fragment-free page links in ``html`` on the same host as ``url``"""
+    host = urlsplit(url).netloc
+    links = []
+    for tag in BeautifulSoup(html, "lxml", parse_only=SoupStrainer("a", href=True)).find_all("a"):
+        link = urldefrag(urljoin(url, tag["href"]))[0]
+        parts = urlsplit(link)
+        if parts.scheme in ("http", "https") and parts.netloc == host and not parts.path.lower().endswith(_SKIPPED_SUFFIXES):
+            links.append(link)
+    return list(dict.fromkeys(links))
+
+
+class Prefetcher:
+    """Keep every mirrored page fresh in ``cache`` so viewers only ever hit it
+
+    Seeds, plus same-site links followed up to ``depth`` hops (at most
+    ``max_pages`` URLs in total), are refreshed every ``interval`` seconds
+    by a scheduler thread. Refreshes run concurrently on ``workers``
+    threads, with at most ``per_host`` in flight per host. A failing URL
+    backs off exponentially from ``retry_after`` up to ``max_backoff``
+    seconds, and keeps being served from its last good copy meanwhile.
+    A page another process refreshed within ``interval`` is adopted from
+    the shared disk store instead of being fetched again.
+    """
+
+    def __init__(self, cache, seeds, depth=0, interval=240, per_host=2, workers=8, max_pages=50,
+                 retry_after=30, max_backoff=3600, tick=1.0):
+        self.cache = cache
+        self.depth = depth
+        self.interval = interval
+        self.per_host = per_host
+        self.max_pages = max_pages
+        self.retry_after = retry_after
+        self.max_backoff = max_backoff
+        self.tick = tick
+        self.targets = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        for url in seeds:
+            self.add(url, 0)
+
+    def add(self, url, depth):
+        """Track ``url`` if there is room; returns True if it is (now) tracked"""
+        with self._lock:
+            if url in self.targets:
+                return True
+            if len(self.targets) >= self.max_pages:
+                return False
+            self.targets[url] = Target(url, depth)
+            return True
+
+    def urls(self):
+        """Tracked URLs, seeds first"""
+        with self._lock:
+            return sorted(self.targets, key=lambda url: (self.targets[url].depth, url))
+
+    def start(self):
+        """Run the scheduler in a daemon thread (idempotent)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="prefetch-scheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.schedule()
+            except RuntimeError:
+                # The executor is gone: the interpreter is shutting down
+                return
+            self._stop.wait(self.tick)
+
+    def schedule(self):
+        """Submit every due URL whose host has a free slot"""
+        now = time.time()
+        with self._lock:
+            busy = {}
+            for target in self.targets.values():
+                if target.in_flight:
+                    host = urlsplit(target.url).netloc
+                    busy[host] = busy.get(host, 0) + 1
+            for target in sorted(self.targets.values(), key=lambda target: target.due):
+                host = urlsplit(target.url).netloc
+                if target.in_flight or target.due > now or busy.get(host, 0) >= self.per_host:
+                    continue
+                busy[host] = busy.get(host, 0) + 1
+                target.in_flight = True
+                self._executor.submit(self._run, target)
+
+    def _run(self, target):
+        try:
+            page = self.cache.refresh(target.url, max_age=self.interval)
+            if page.failures:
+                delay = min(self.retry_after * 2 ** (page.failures - 1), self.max_backoff)
+                due = time.time() + delay
+            else:
+                due = page.checked_at + self.interval
+            if page.text is not None and target.depth < self.depth:
+                for link in same_site_links(page.text, target.url):
+                    if not self.add(link, target.depth + 1):
+                        break
+        except Exception:
+            due = time.time() + self.retry_after
+        with self._lock:
+            target.due = due
+            target.in_flight = False
+
+    def stats(self):
+        """One row per tracked URL: freshness, latency and schedule"""
+        now = time.time()
+        # Snapshot the schedule under the lock; workers update it concurrently
+        with self._lock:
+            schedule = [(url, target.depth, target.in_flight, target.due) for url, target in self.targets.items()]
+        rows = []
+        # Seeds first, as in urls()
+        for url, depth, in_flight, due in sorted(schedule, key=lambda entry: (entry[1], entry[0])):
+            row = self.cache.page(url).stats(now)
+            row["Depth"] = depth
+            row["Next refresh (s)"] = "running" if in_flight else round(max(due - now, 0), 1)
+            rows.append(row)
+        return rows
@@ -0,0 +1,134 @@
+"""Compressed, byte-bounded on-disk LRU cache shared by every process on a host"""
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import time
+import zlib
+
+SUFFIX = ".zc"
+PARTIAL_SUFFIX = ".part"
+
+# Temp files older than this were left by a crashed writer and are removed on eviction
+PARTIAL_MAX_AGE = 600
+
+
+class DiskCache:
+    """zlib-compressed entries under ``directory``, evicted LRU past ``max_bytes``
+
+    Each entry is one file named by the SHA-256 of its key: a JSON metadata
+    line followed by the compressed payload. Files are written to a temp
+    name unique to the writer and renamed into place, so readers in other
+    threads and processes only ever see complete entries. Reads memory-map the file and decompress straight
+    from the map. A file's mtime is its last use, and eviction removes the
+    least recently used files until the directory fits the byte budget.
+    """
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024, level=6):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.level = level
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        """File holding ``key``"""
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + SUFFIX)
+
+    def get(self, key):
+        """``(metadata, payload bytes)`` for ``key``, or None if absent or unreadable"""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                split = mapped.find(b"\n")
+                metadata = json.loads(mapped[:split])
+                view = memoryview(mapped)
+                try:
+                    payload = zlib.decompress(view[split + 1:])
+                finally:
+                    view.release()
+            os.utime(path)
+        except (OSError, ValueError, zlib.error):
+            # Missing, evicted by another process mid-read, empty or corrupt
+            return None
+        if metadata.get("key") != key:
+            return None
+        return metadata, payload
+
+    def put(self, key, payload, **metadata):
+        """Store ``payload`` (bytes) with JSON-serializable ``metadata``"""
+        path = self.path(key)
+        header = json.dumps({**metadata, "key": key, "stored_at": time.time()}).encode("utf-8")
+        descriptor, partial = tempfile.mkstemp(suffix=PARTIAL_SUFFIX, dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(header + b"\n")
+                f.write(zlib.compress(payload, self.level))
+            os.replace(partial, path)
+        except BaseException:
+            try:
+                os.remove(partial)
+            except FileNotFoundError:
+                pass
+            raise
+        self.evict()
+
+    def delete(self, key):
+        """Drop ``key`` if present"""
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def _scan(self, suffix):
+        """``(mtime, size, path)`` of files ending in ``suffix``, oldest first"""
+        found = []
+        with os.scandir(self.directory) as listing:
+            for entry in listing:
+                if not entry.name.endswith(suffix):
+                    continue
+                try:
+                    info = entry.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((info.st_mtime, info.st_size, entry.path))
+        found.sort()
+        return found
+
+    def entries(self):
+        """``(last_used, size, path)`` for every stored entry, oldest first"""
+        return self._scan(SUFFIX)
+
+    def partials(self):
+        """Temp files still being written, or abandoned by a crashed writer; cleans up the latter
+
+        Returns ``(mtime, size, path)`` of the ones kept.
+        """
+        kept = []
+        cutoff = time.time() - PARTIAL_MAX_AGE
+        for mtime, size, path in self._scan(PARTIAL_SUFFIX):
+            if mtime >= cutoff:
+                kept.append((mtime, size, path))
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        return kept
+
+    def total_bytes(self):
+        """Bytes currently used on disk, including temp files in progress"""
+        return sum(size for _, size, _ in self.entries() + self.partials())
+
+    def evict(self):
+        """Remove least recently used entries until the budget (temp files included) is met"""
+        found = self.entries()
+        total = sum(size for _, size, _ in found + self.partials())
+        for _, size, path in found:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
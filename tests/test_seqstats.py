@@ -0,0 +1,33 @@
+"""Streamed sequence statistics must not depend on how the input is chunked"""
+import io
+
+import numpy as np
+import pytest
+
+from algorithms.seqstats import scan_sequences
+
+
+def random_fasta(rng):
+    """Two records: random bases (with N and line breaks) of random length, then a short fixed one"""
+    body = bytes(rng.choice(list(b"ACGTN\n"), int(rng.integers(1, 200))))
+    return b">a\n" + body + b"\n>b\nACGTTGCA\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 6, 7, 8, 13])
+def test_chunked_scan_matches_unchunked(chunk_size):
+    rng = np.random.default_rng(chunk_size)
+    for _ in range(50):
+        fasta = random_fasta(rng)
+        k = int(rng.integers(1, 9))
+        profiles, kmers = scan_sequences(io.BytesIO(fasta), k=k, chunk_size=1 << 20)
+        chunked, chunked_kmers = scan_sequences(io.BytesIO(fasta), k=k, chunk_size=chunk_size)
+        np.testing.assert_array_equal(chunked_kmers, kmers)
+        assert [profile.name for profile in chunked] == [profile.name for profile in profiles]
+        for one, other in zip(chunked, profiles):
+            np.testing.assert_array_equal(one.counts, other.counts)
+
+
+@pytest.mark.parametrize("chunk_size", [6, 7])
+def test_kmers_across_chunks_shorter_than_k(chunk_size):
+    _, kmers = scan_sequences(io.BytesIO(b">r\nACGTACGTACGT\n"), k=6, chunk_size=chunk_size)
+    assert kmers.sum() == 7
@@ -0,0 +1,29 @@
+"""Portfolio pages, each imported only when it is first shown"""
+import importlib
+
+# Page name (as stored in st.session_state.current_page) -> module with a render() function
+PAGES = {
+    "Home": "views.home",
+    "Projects": "views.projects",
+    "Skills Lab": "views.skills_lab",
+    "Algorithms": "views.algorithms",
+    "Contact": "views.contact",
+}
+
+
+def render(page):
+    """Import ``page``'s module on first use and draw it"""
+    importlib.import_module(PAGES[page]).render()
+
+
+def slug(page):
+    """URL form of a page name, e.g. Skills Lab -> skills-lab"""
+    return page.lower().replace(" ", "-")
+
+
+def page_for_slug(value, default="Home"):
+    """Page named by a ``?page=`` query value, or ``default`` if it names none"""
+    for page in PAGES:
+        if slug(page) == value:
+            return page
+    return default
@@ -0,0 +1,39 @@
+"""Algorithms page: picks a visualizer and imports only that one"""
+import importlib
+
+import streamlit as st
+
+from diagnostics.timings import timed
+
+# Visualizer label -> module with a render() function
+VISUALIZERS = {
+    "Sequence Alignment Sort": "views.visualizers.sorting",
+    "Pairwise Alignment": "views.visualizers.pairwise",
+    "Protein Pattern": "views.visualizers.protein_pattern",
+    "Genomic Matrix": "views.visualizers.genomic_matrix",
+    "Gene Expression Sequence": "views.visualizers.gene_expression",
+    "Sequence Statistics": "views.visualizers.sequence_statistics",
+}
+
+
+@timed
+def create_rotating_algorithm_viz():
+    """Create an interactive rotating algorithm visualization for biotech applications"""
+    st.markdown("### 🔬 Biotech Algorithm Visualization")
+    
+    # Algorithm selection
+    algorithm = st.selectbox(
+        "Choose Algorithm to Visualize:",
+        list(VISUALIZERS)
+    )
+    
+    # Only the chosen visualizer (and the NumPy/pandas code behind it) is imported
+    importlib.import_module(VISUALIZERS[algorithm]).render()
+
+
+@timed
+def render():
+    """Interactive algorithms page"""
+    st.markdown('<h2 class="section-header">🧬 Biotech Algorithm Visualizations</h2>', unsafe_allow_html=True)
+    
+    create_rotating_algorithm_viz()
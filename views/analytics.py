@@ -0,0 +1,74 @@
+"""Footer analytics: real page views, recorded per session and summarised per month"""
+import atexit
+import os
+import uuid
+
+import streamlit as st
+
+from analytics.pageviews import PageViews
+from diagnostics.timings import timed
+
+# SQLite file the views are appended to (in the app folder, wherever the server
+# was started); overridable so benchmarks keep their own
+DB_PATH = os.environ.get(
+    "PORTFOLIO_ANALYTICS_DB",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "analytics.sqlite3"),
+)
+
+
+@st.cache_resource(show_spinner=False)
+def get_page_views():
+    """The process-wide page-view log, flushed by its own thread"""
+    folder = os.path.dirname(DB_PATH)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    page_views = PageViews(DB_PATH).start()
+    # Views still queued at shutdown are written rather than lost
+    atexit.register(page_views.stop)
+    return page_views
+
+
+def record_view(page):
+    """Count a view of ``page`` when this session arrives on it (not on every rerun)"""
+    if 'visitor_id' not in st.session_state:
+        st.session_state.visitor_id = uuid.uuid4().hex
+    if st.session_state.get('analytics_page') == page:
+        return
+    st.session_state.analytics_page = page
+    get_page_views().record(st.session_state.visitor_id, page)
+
+
+def change(current, previous):
+    """Month-on-month change as a metric delta, or None without last month's figure"""
+    if not previous:
+        return None
+    return f"{(current - previous) / previous:+.0%}"
+
+
+def duration(seconds):
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}m {seconds:02d}s"
+
+
+@timed
+def render():
+    """Totals for this month against last month, from the precomputed aggregates"""
+    summary = get_page_views().summary()
+    current, previous = summary["current"], summary["previous"]
+    st.info(f"📈 Portfolio analytics: {current['views']:,} views this month!")
+
+    with st.expander("📊 Detailed Analytics"):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Total Views", f"{current['views']:,}", change(current["views"], previous["views"]))
+        col2.metric("Unique Visitors", f"{current['visitors']:,}", change(current["visitors"], previous["visitors"]))
+        col3.metric(
+            "Avg. Time", duration(current["avg_visit_seconds"]),
+            change(current["avg_visit_seconds"], previous["avg_visit_seconds"]),
+        )
+        if current["pages"]:
+            pages = sorted(current["pages"].items(), key=lambda item: -item[1])
+            st.dataframe(
+                [{"Page": page, "Views": views} for page, views in pages],
+                width="stretch", hide_index=True,
+            )
+        st.caption(f"{summary['month']} · {summary['pending']} recent views not yet included (saved every few seconds)")
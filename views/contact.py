@@ -0,0 +1,91 @@
+"""Contact page: contact options, message form and resume download"""
+import os
+
+import streamlit as st
+
+from diagnostics.timings import timed
+
+# Resume offered on the contact page
+RESUME_PATH = os.path.join("assets", "resume.pdf")
+
+
+@st.cache_resource(max_entries=2)
+def load_resume(file_path, modified):
+    """Resume bytes, read once per process and again only when the file changes"""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def resume_download_button(file_path, download_filename):
+    """Resume download served from the media endpoint; reruns carry no file bytes"""
+    try:
+        modified = os.path.getmtime(file_path)
+    except OSError:
+        st.markdown('''
+        <div style="padding: 1rem; background-color: #E8F5E9; border-radius: 8px; border-left: 4px solid #2E7D32;">
+            <p style="margin: 0; color: #1B5E20;">
+                📄 <strong>Resume Download:</strong> Add your resume.pdf file to the assets folder to enable download functionality.
+            </p>
+        </div>
+        ''', unsafe_allow_html=True)
+        return
+    
+    # Deferred: the bytes are only produced when the button is clicked
+    st.download_button(
+        "📄 Download Resume",
+        lambda: load_resume(file_path, modified),
+        file_name=download_filename,
+        mime="application/pdf",
+        on_click="ignore",
+        key="resume_download",
+    )
+
+
+@timed
+def render():
+    """Interactive contact page"""
+    st.markdown('<h2 class="section-header">📬 Interactive Contact Hub</h2>', unsafe_allow_html=True)
+    
+    contact_col1, contact_col2 = st.columns([1, 1])
+    
+    with contact_col1:
+        st.markdown("### 📞 Connect With Me")
+        
+        # Interactive contact buttons
+        contact_methods = [
+            ("📧 Send Email", "✉️ Email client opened! (mailto:jane.smith@email.com)"),
+            ("💼 LinkedIn Profile", "🔗 LinkedIn opened in new tab!"),
+            ("💻 GitHub Portfolio", "🐱 GitHub profile opened!"),
+            ("📱 Schedule Call", "📅 Calendar booking opened!")
+        ]
+        
+        for button_text, success_msg in contact_methods:
+            if st.button(button_text, key=f"contact_{button_text}"):
+                st.success(success_msg)
+        
+        resume_download_button(RESUME_PATH, "Jane_Smith_Resume.pdf")
+    
+    with contact_col2:
+        st.markdown("### 💌 Quick Message")
+        
+        with st.form("contact_form"):
+            name = st.text_input("Your Name")
+            email = st.text_input("Your Email")
+            subject = st.selectbox("Subject", ["Research Inquiry", "Collaboration Opportunity", "Lab Partnership", "Other"])
+            message = st.text_area("Your Message")
+            
+            submitted = st.form_submit_button("🚀 Send Message")
+            
+            if submitted:
+                if name and email and message:
+                    st.success("🎉 Message sent successfully!")
+                    st.balloons()
+                    
+                    # Show confirmation details
+                    with st.expander("📋 Message Details"):
+                        st.write(f"**Name:** {name}")
+                        st.write(f"**Email:** {email}")
+                        st.write(f"**Subject:** {subject}")
+                        st.write(f"**Message:** {message}")
+                else:
+                    st.error("❌ Please fill in all required fields")
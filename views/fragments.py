@@ -0,0 +1,73 @@
+"""Immutable page fragments, built once per process
+
+Streamlit re-sends every element on every rerun unless the browser already
+holds an identical one: elements of at least ``global.minCachedMessageSize``
+bytes (lowered in .streamlit/config.toml) are then sent as a reference to
+their content hash. Static blocks are therefore prepared once, at import, so
+their bytes (and hash) never vary between runs, and the stylesheet is a
+static file the browser fetches once instead of a <style> block re-sent with
+every run.
+"""
+import hashlib
+import os
+import re
+import textwrap
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Served at app/static/ when server.enableStaticServing is on (the folder next to the main script)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+_BETWEEN_TAGS = re.compile(r">\s+<")
+
+
+def compact_html(html):
+    """HTML with indentation and the whitespace between tags removed"""
+    lines = (line.strip() for line in html.strip().splitlines())
+    return _BETWEEN_TAGS.sub("><", " ".join(line for line in lines if line))
+
+
+def compact_markdown(text):
+    """Dedented markdown without leading or trailing blank lines"""
+    return textwrap.dedent(text).strip()
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def stylesheet_version(name):
+    """``(content hash, css)`` of a file in ``STATIC_DIR``; re-read at most once a minute"""
+    with open(os.path.join(STATIC_DIR, name), encoding="utf-8") as f:
+        css = f.read()
+    return hashlib.sha256(css.encode("utf-8")).hexdigest()[:12], css
+
+
+def served_statically():
+    """Whether ``STATIC_DIR`` is the folder Streamlit serves at app/static/"""
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    ctx = get_script_run_ctx(suppress_warning=True)
+    script = getattr(ctx, "main_script_path", None)
+    return bool(script) and os.path.join(os.path.dirname(os.path.abspath(script)), "static") == STATIC_DIR
+
+
+def stylesheet(name):
+    """Apply a stylesheet from ``STATIC_DIR``
+
+    With static serving on, only an ``@import`` of the file is sent; the
+    content hash in its URL changes whenever the file does, so the browser
+    keeps using its copy until then. Otherwise (static serving off, or the
+    app served from another script's folder) the CSS is inlined.
+    """
+    version, css = stylesheet_version(name)
+    if served_statically():
+        st.html(f'<style>@import url("app/static/{name}?v={version}");</style>')
+    else:
+        st.html(f"<style>{css}</style>")
+
+
+FOOTER_HTML = compact_html("""
+    <div style="text-align: center; padding: 2rem; color: #666;">
+        <p>© 2025 Jane Smith. Built with ❤️ using Streamlit</p>
+        <p>✨ Biotech Portfolio - Explore, Discover, Innovate! ✨</p>
+    </div>
+    """)
@@ -0,0 +1,95 @@
+"""Home page: header, profile picture, stats and background"""
+import os
+
+import streamlit as st
+
+from diagnostics.timings import timed
+from views.fragments import compact_html, compact_markdown
+from views.images import show_image
+
+# Portrait, shown as a display-sized variant
+PROFILE_IMAGE = os.path.join("assets", "profile.jpg")
+
+# Static blocks, prepared once per process (see views.fragments)
+HEADER_HTML = compact_html("""
+    <div class="main-header">
+        <div class="rotating-element" style="display: inline-block; font-size: 2rem;">🧬</div>
+        <h1>🧪 Jane Smith</h1>
+        <h3>Biotechnology Graduate & Researcher</h3>
+        <p>Advancing healthcare through innovative biotech solutions</p>
+    </div>
+    """)
+
+ABOUT_MARKDOWN = compact_markdown("""
+    Welcome to my biotech portfolio! I'm a dedicated Biotechnology graduate with over 3 years of experience 
+    in molecular biology, bioinformatics, and genomic data analysis. My passion lies in developing innovative solutions 
+    for healthcare and advancing scientific discovery.
+
+    **🎓 Education:**
+    - Master's in Biotechnology - MIT (2022)
+    - Bachelor's in Molecular Biology - UC San Diego (2020)
+
+    **🧪 Background:**
+    I've worked in academic labs and biotech startups, contributing to projects on gene editing, 
+    protein modeling, and genomic sequencing. My expertise includes CRISPR, bioinformatics pipelines, 
+    and data-driven biological insights.
+    """)
+
+ACHIEVEMENTS = (
+    "🥇 Biotech Hackathon Winner 2023",
+    "📝 Published 2 research papers",
+    "🌟 Presented at 3 conferences",
+    "🧬 Developed novel CRISPR pipeline",
+    "🔬 Mentored 5 junior researchers",
+)
+
+
+@timed
+def render():
+    """Render the home page with animations"""
+    # Header Section with rotating element
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+    # Profile Picture with hover effect
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        show_image(PROFILE_IMAGE, 300, "Profile Picture", """
+            <div style="text-align: center; padding: 2rem; background-color: #F5F5F5; border-radius: 10px; margin: 1rem 0;" class="pulse-animation">
+                <div style="font-size: 4rem;">🧪</div>
+                <p style="color: #666; margin-top: 1rem;">Profile Picture</p>
+                <small style="color: #999;">Add your profile.jpg to the assets folder</small>
+            </div>
+            """)
+
+    # Interactive Quick Stats
+    st.markdown("### 📊 Biotech Stats Dashboard")
+    stat_col1, stat_col2, stat_col3, stat_col4 = st.columns(4)
+    
+    stats = [
+        ("3+", "Years Research", "🔬"),
+        ("10+", "Projects Completed", "🧪"),
+        ("5+", "Lab Techniques", "🧫"),
+        ("2", "Publications", "📝")
+    ]
+    
+    for i, (stat_col, (number, text, emoji)) in enumerate(zip([stat_col1, stat_col2, stat_col3, stat_col4], stats)):
+        with stat_col:
+            if st.button(f"{emoji} {number}", key=f"stat_{i}"):
+                st.balloons()
+            st.markdown(f"<p style='text-align: center; margin-top: 0.5rem;'>{text}</p>", unsafe_allow_html=True)
+
+    # About Me Section
+    st.markdown('<h2 class="section-header">🙋‍♀️ About Me</h2>', unsafe_allow_html=True)
+    
+    about_col1, about_col2 = st.columns([2, 1])
+    
+    with about_col1:
+        st.markdown(ABOUT_MARKDOWN)
+    
+    with about_col2:
+        st.markdown("### 🏆 Achievements")
+        
+        for achievement in ACHIEVEMENTS:
+            if st.button(achievement, key=f"achieve_{achievement}"):
+                st.success(f"Thanks for your interest in: {achievement}")
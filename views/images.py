@@ -0,0 +1,35 @@
+"""Display-sized asset images shared across sessions"""
+import os
+
+import streamlit as st
+
+from media import images
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def image_modified(file_path):
+    """mtime of an image file, or None if it is missing; checked at most once a minute"""
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def get_display_image(file_path, modified, width):
+    """1x and 2x encoded variants of an image, decoded once per process"""
+    return images.display_variants(file_path, width)
+
+
+def show_image(file_path, width, caption, fallback_html, fit_column=False):
+    """Display-sized HiDPI variant of an asset image, or the placeholder if it is missing"""
+    modified = image_modified(file_path)
+    if modified is None:
+        st.markdown(fallback_html, unsafe_allow_html=True)
+        return
+    # The 2x variant drawn at display width stays sharp on HiDPI screens
+    variant = get_display_image(file_path, modified, width)[2]
+    if fit_column:
+        st.image(variant, caption=caption, width="stretch")
+    else:
+        st.image(variant, width=width, caption=caption)
@@ -0,0 +1,213 @@
+"""Projects page: CRISPR guide finder, genomic dashboard and protein AI"""
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from algorithms import crispr, expression
+from diagnostics.timings import timed
+from views.images import show_image
+from views.shared import GENOME_DIR, stage_upload
+
+# Project artwork, shown as a display-sized variant
+PROJECT_IMAGE = os.path.join("assets", "project1.jpg")
+
+# Parquet copies of uploaded expression matrices, keyed by content hash
+EXPRESSION_CACHE_DIR = os.path.join(tempfile.gettempdir(), "portfolio-expression")
+
+
+@st.cache_resource(show_spinner="Indexing reference genome...", max_entries=4)
+def get_guide_index(path, modified, pam, length, max_mismatches):
+    """Seed index for one reference file, shared across sessions until the file changes"""
+    return crispr.GuideIndex(path, pam=pam, length=length, max_mismatches=max_mismatches)
+
+
+@timed
+def create_guide_rna_finder():
+    """Scan a reference for PAM sites and rank guides by off-target load"""
+    st.markdown("#### 🔎 Guide RNA Finder")
+    
+    source = st.radio("Reference:", ["Upload FASTA", "Local reference"], horizontal=True, key="crispr_source")
+    path = None
+    if source == "Upload FASTA":
+        uploaded = st.file_uploader("Reference FASTA", type=["fa", "fasta", "fna", "txt"], key="crispr_upload")
+        if uploaded is not None:
+            path = stage_upload(uploaded)
+    else:
+        references = sorted(
+            name for name in os.listdir(GENOME_DIR) if name.endswith((".fa", ".fasta", ".fna"))
+        ) if os.path.isdir(GENOME_DIR) else []
+        if references:
+            path = os.path.join(GENOME_DIR, st.selectbox("Reference file:", references, key="crispr_reference"))
+        else:
+            st.info(f"📂 Add .fa/.fasta/.fna files to {GENOME_DIR} to scan local references.")
+    
+    col1, col2, col3 = st.columns(3)
+    pam_label = col1.selectbox("PAM:", list(crispr.PAM_PRESETS) + ["Custom"], key="crispr_pam")
+    if pam_label == "Custom":
+        pam = col1.text_input("Custom PAM (IUPAC, 3' of protospacer):", "NGG", key="crispr_custom_pam").strip().upper()
+    else:
+        pam = crispr.PAM_PRESETS[pam_label]
+    length = col2.slider("Protospacer length:", 17, 24, 20, key="crispr_length")
+    max_mismatches = col3.slider("Off-target mismatches:", 0, 4, 3, key="crispr_mismatches")
+    
+    window_col1, window_col2, window_col3 = st.columns(3)
+    record_name = window_col1.text_input("Record (blank = first):", key="crispr_record").strip()
+    window_start = window_col2.number_input("Target window start:", min_value=1, value=1, key="crispr_start")
+    window_end = window_col3.number_input("Target window end:", min_value=1, value=5000, key="crispr_end")
+    
+    if st.button("🧬 Find Guide RNAs", key="crispr_find"):
+        if path is None:
+            st.error("❌ Choose a reference FASTA first")
+            return
+        if not pam or any(letter not in crispr.IUPAC for letter in pam):
+            st.error("❌ PAM must use IUPAC nucleotide letters (A, C, G, T, R, Y, N, ...)")
+            return
+        
+        index = get_guide_index(path, os.path.getmtime(path), pam, length, max_mismatches)
+        if not index.names:
+            st.error("❌ The reference FASTA is empty")
+            return
+        if record_name and record_name not in index.names:
+            st.error(f"❌ Record '{record_name}' not found in the reference")
+            return
+        record = index.names.index(record_name) if record_name else 0
+        rows, per_query = crispr.design_guides(index, record, int(window_start) - 1, int(window_end))
+        
+        metric_cols = st.columns(4)
+        metric_cols[0].metric("Bases indexed", f"{index.bases:,}")
+        metric_cols[1].metric("PAM sites", f"{len(index):,}")
+        metric_cols[2].metric(
+            "Index build",
+            f"{index.build_seconds:.2f} s",
+            f"{index.bases / max(index.build_seconds, 1e-9) / 1e6:.1f} Mb/s",
+            delta_color="off",
+        )
+        metric_cols[3].metric(
+            "Off-target query",
+            f"{per_query * 1000:.2f} ms",
+            f"{1 / max(per_query, 1e-9):,.0f} guides/s",
+            delta_color="off",
+        )
+        st.caption(f"Index memory: {index.nbytes() / 1024 ** 2:.1f} MB")
+        
+        if rows:
+            st.dataframe(pd.DataFrame(rows), width="stretch")
+        else:
+            st.warning(f"No {pam} sites found in the selected window")
+
+
+@st.cache_data(max_entries=8)
+def get_expression_samples(path, samples):
+    """Sample columns read from a cached Parquet matrix"""
+    return expression.read_samples(path, samples)
+
+
+@timed
+def create_expression_dashboard():
+    """Expression matrix explorer: Parquet-cached uploads and downsampled plots"""
+    uploaded = st.file_uploader(
+        "Expression matrix (CSV/TSV, first column = gene IDs)",
+        type=["csv", "tsv", "txt", "gz"],
+        key="expression_upload",
+    )
+    col1, col2 = st.columns(2)
+    method = col1.radio("Downsampling:", list(expression.DOWNSAMPLERS), horizontal=True, key="expression_method")
+    points = col2.slider("Points sent to the browser:", 500, 5000, 2000, key="expression_points")
+    
+    if uploaded is None:
+        # Create interactive demo
+        if st.button("🎮 Launch Interactive Demo", key="analytics_demo"):
+            # One million synthetic expression readings, downsampled before plotting
+            data = np.random.randn(1_000_000).cumsum() + 100
+            keep = expression.DOWNSAMPLERS[method](data, points)
+            st.line_chart(pd.DataFrame({"Expression Level": data[keep]}, index=pd.Index(keep, name="Reading")))
+            st.caption(f"Showing {len(keep):,} of {len(data):,} points ({method})")
+            st.success("🎯 Genomic demo loaded!")
+        return
+    
+    # Hash and convert once per upload, not on every widget change
+    converted = st.session_state.setdefault("expression_parquet", {})
+    if uploaded.file_id not in converted or not os.path.exists(converted[uploaded.file_id][0]):
+        try:
+            result = expression.cached_parquet(uploaded, EXPRESSION_CACHE_DIR, uploaded.name)
+        except ValueError as error:
+            st.error(f"❌ {error}")
+            return
+        converted.clear()
+        converted[uploaded.file_id] = result
+    path, cache_hit, seconds = converted[uploaded.file_id]
+    rows, samples = expression.matrix_shape(path)
+    st.caption(
+        f"{rows:,} genes × {len(samples):,} samples · "
+        + (f"Parquet cache hit in {seconds:.2f} s" if cache_hit else f"converted to Parquet in {seconds:.2f} s")
+    )
+    if not samples:
+        st.error("❌ The matrix needs at least one sample column after the gene ID column")
+        return
+    
+    selected = st.multiselect("Samples to plot:", samples, default=samples[:1], max_selections=5, key="expression_samples")
+    if selected:
+        series = []
+        for name, values in get_expression_samples(path, tuple(selected)).items():
+            keep = expression.DOWNSAMPLERS[method](values, points)
+            series.append(pd.Series(values[keep], index=keep, name=name))
+        chart = pd.concat(series, axis=1).sort_index()
+        chart.index.name = "Gene (row)"
+        st.line_chart(chart)
+        st.caption(f"Showing {len(chart):,} of {rows:,} rows per sample ({method})")
+
+
+@timed
+def render():
+    """Render interactive projects page"""
+    st.markdown('<h2 class="section-header">🧪 Biotech Project Showcase</h2>', unsafe_allow_html=True)
+    
+    project_tabs = st.tabs(["🧬 CRISPR Tool", "📊 Genomic Dashboard", "🤖 Protein AI"])
+    
+    with project_tabs[0]:
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            show_image(PROJECT_IMAGE, 480, "CRISPR Analysis Tool", """
+                <div style="text-align: center; padding: 3rem 1rem; background-color: #F5F5F5; border-radius: 8px; margin: 1rem 0;" class="pulse-animation">
+                    <div style="font-size: 3rem;">🧬</div>
+                    <p style="color: #666; margin: 0.5rem 0;">CRISPR Analysis Tool</p>
+                </div>
+                """, fit_column=True)
+        
+        with col2:
+            st.markdown("### 🧬 CRISPR Analysis Tool")
+            st.markdown("**Technologies:** Python, Biopython, Streamlit, Pandas")
+            
+            if st.button("🚀 View Live Demo", key="demo1"):
+                st.success("🎉 Demo launched! (This would open in a new tab)")
+                st.balloons()
+            
+            if st.button("📋 View Code", key="code1"):
+                st.info("📂 GitHub repository opened! (This would redirect to GitHub)")
+            
+        
+        create_guide_rna_finder()
+
+    with project_tabs[1]:
+        st.markdown("### 📊 Genomic Data Visualization")
+        create_expression_dashboard()
+
+    with project_tabs[2]:
+        st.markdown("### 🤖 Protein Modeling AI")
+        
+        if st.button("💬 Interact with AI Demo", key="chatbot_demo"):
+            st.chat_message("assistant").write("Hello! I'm a protein modeling AI. Ask me about protein structures!")
+            
+            user_input = st.chat_input("Type your question...")
+            if user_input:
+                st.chat_message("user").write(user_input)
+                responses = [
+                    f"Thanks for asking about: '{user_input}'. That's a great topic!",
+                    f"I understand you mentioned '{user_input}'. Want to explore its structure?",
+                    f"Interesting query about '{user_input}'! Let me analyze that.",
+                ]
+                st.chat_message("assistant").write(np.random.choice(responses))
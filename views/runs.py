@@ -0,0 +1,139 @@
+"""Process-wide cap on heavy visualizer runs, with queuing, pacing and cancellation
+
+Streamlit gives every session its own script thread, so a burst of users
+starting large visualizations at once would all compute at the same time.
+``limited_run`` lets at most ``MAX_CONCURRENT_RUNS`` of them work at once;
+the rest wait in line, showing their place. Every queue update is a
+Streamlit yield point, so a queued run whose user navigated away ends at
+once. Runs that stream frames check ``Pacer.checkpoint`` per frame: it
+stops the run as soon as a rerun or stop is pending and after ``budget``
+seconds, and says when enough time has passed to draw the next frame.
+"""
+import contextlib
+import os
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from diagnostics.timings import timer
+
+# Heavy runs computing at once across all sessions
+MAX_CONCURRENT_RUNS = max(2, os.cpu_count() or 2)
+
+# How often a queued run re-checks for a free slot (and for being abandoned)
+QUEUE_POLL = 0.25
+
+
+class RunCancelled(Exception):
+    """Raised at a checkpoint once the user has moved on"""
+
+
+class RunSlots:
+    """Counting semaphore that also knows how many runs are waiting"""
+
+    def __init__(self, size):
+        self.size = size
+        self.waiting = 0
+        self._semaphore = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout):
+        return self._semaphore.acquire(timeout=timeout)
+
+    def release(self):
+        self._semaphore.release()
+
+    @contextlib.contextmanager
+    def queued(self):
+        with self._lock:
+            self.waiting += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+
+@st.cache_resource
+def get_run_slots():
+    """Slots shared by every session in the process"""
+    return RunSlots(MAX_CONCURRENT_RUNS)
+
+
+def _pending_request(ctx):
+    """Name of the request waiting for ``ctx``'s script thread, or None if unknown
+
+    Streamlit has no public way to ask this, so it reads the private
+    ``ScriptRequests._state``; if a Streamlit release renames it, runs are
+    simply never cancelled early.
+    """
+    try:
+        return ctx.script_requests._state.name
+    except AttributeError:
+        return None
+
+
+def cancel_requested():
+    """Whether a rerun or stop is waiting for this session's script thread
+
+    Peeks at the pending request without consuming it; Streamlit acts on
+    it at the next element the script sends.
+    """
+    state = _pending_request(get_script_run_ctx(suppress_warning=True))
+    return state is not None and state != "CONTINUE"
+
+
+class Pacer:
+    """Frame pacing against a time budget for one run"""
+
+    def __init__(self, frame_interval=0.1, budget=10.0):
+        self.frame_interval = frame_interval
+        self.budget = budget
+        self.start = time.perf_counter()
+        self.last_frame = None
+        self.exhausted = False
+        # Set by limited_run once the block ran to the end without being cancelled
+        self.completed = False
+
+    def checkpoint(self):
+        """True when the next frame is due; raises ``RunCancelled`` if the user moved on
+
+        Sets ``exhausted`` (and returns True so the caller can flush) once the
+        budget is spent.
+        """
+        if cancel_requested():
+            raise RunCancelled()
+        now = time.perf_counter()
+        if now - self.start >= self.budget:
+            self.exhausted = True
+            return True
+        if self.last_frame is None or now - self.last_frame >= self.frame_interval:
+            self.last_frame = now
+            return True
+        return False
+
+
+@contextlib.contextmanager
+def limited_run(label, frame_interval=0.1, budget=10.0):
+    """Hold one of the process-wide run slots for the ``with`` block; yields a ``Pacer``
+
+    A ``RunCancelled`` raised in the block ends it quietly; the pending
+    rerun then takes over at the script's next element. Check the pacer's
+    ``completed`` after the block before reporting success.
+    """
+    slots = get_run_slots()
+    status = st.empty()
+    with timer(f"queue wait: {label}"), slots.queued():
+        while not slots.acquire(timeout=QUEUE_POLL):
+            status.info(f"⏳ {label} is queued: {slots.size} visualizations are running, {slots.waiting} waiting")
+    status.empty()
+    pacer = Pacer(frame_interval, budget)
+    try:
+        yield pacer
+        pacer.completed = True
+    except RunCancelled:
+        pass
+    finally:
+        slots.release()
@@ -0,0 +1,29 @@
+"""Helpers shared by several pages"""
+import hashlib
+import os
+import tempfile
+
+# Local reference genomes offered by the CRISPR guide finder
+GENOME_DIR = os.path.join("assets", "genomes")
+
+
+def stage_upload(uploaded):
+    """Store an uploaded FASTA under its content hash so it can be memory-mapped"""
+    data = uploaded.getvalue()
+    folder = os.path.join(tempfile.gettempdir(), "portfolio-genomes")
+    path = os.path.join(folder, f"{hashlib.sha256(data).hexdigest()}.fa")
+    if not os.path.exists(path):
+        os.makedirs(folder, exist_ok=True)
+        # Every session shares this process, so each write gets its own temp file
+        descriptor, partial = tempfile.mkstemp(suffix=".part", dir=folder)
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(data)
+            os.replace(partial, path)
+        except BaseException:
+            try:
+                os.remove(partial)
+            except FileNotFoundError:
+                pass
+            raise
+    return path
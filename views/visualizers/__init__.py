@@ -0,0 +1 @@
+"""Algorithm visualizers, imported one at a time by the Algorithms page."""
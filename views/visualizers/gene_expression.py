@@ -0,0 +1,113 @@
+"""Gene Expression Sequence: fast-doubling Fibonacci with streamed charts"""
+import math
+import time
+
+import pandas as pd
+import streamlit as st
+
+from algorithms import fibonacci
+from diagnostics.timings import timed
+from frame_player import frame_player
+from views.runs import limited_run
+
+
+def chart_batches(points, column, batch_size=200):
+    """Group (index, value) pairs into DataFrame batches for stream_line_chart"""
+    batch = []
+    for point in points:
+        batch.append(point)
+        if len(batch) == batch_size:
+            yield pd.DataFrame(batch, columns=["Index", column]).set_index("Index")
+            batch = []
+    if batch:
+        yield pd.DataFrame(batch, columns=["Index", column]).set_index("Index")
+
+
+def stream_line_chart(batches, pacer=None):
+    """Draw a line chart batch by batch as points are computed
+
+    Each update redraws the chart with every row so far (Streamlit has no
+    row-append API), so callers keep the series downsampled to a few
+    thousand points. With a ``pacer`` (``views.runs.Pacer``) batches are
+    merged until its next frame is due, which bounds the redraws, and
+    drawing stops once its time budget is spent.
+    """
+    placeholder = st.empty()
+    shown = None
+    pending = []
+
+    def draw(frame):
+        nonlocal shown
+        shown = frame if shown is None else pd.concat([shown, frame])
+        placeholder.line_chart(shown)
+
+    for batch in batches:
+        pending.append(batch)
+        if pacer is not None and not pacer.checkpoint():
+            continue
+        draw(pd.concat(pending) if len(pending) > 1 else pending[0])
+        pending = []
+        if pacer is not None and pacer.exhausted:
+            return
+    if pending:
+        draw(pd.concat(pending))
+
+
+@timed
+def render():
+    """Interactive gene expression sequence visualization"""
+    st.markdown('<div class="algorithm-viz">', unsafe_allow_html=True)
+    n = st.slider("Number of terms:", 5, 500000, 10)
+    
+    if st.button("🧬 Generate Gene Expression Sequence", key="fibonacci"):
+        if n <= 60:
+            fib = list(fibonacci.fibonacci_range(0, n))
+            
+            # Display sequence with animation
+            st.write(f"**Gene Expression Levels:** {fib}")
+            frame_player(
+                "line",
+                fib,
+                range(3, len(fib) + 1),
+                interval_ms=500,
+                title="Expression",
+                key="fibonacci_player",
+            )
+        else:
+            # Large n: at most MAX_CONCURRENT_RUNS sessions compute at once, and
+            # the run stops as soon as the user moves on or its budget is spent
+            with limited_run("Gene expression sequence") as pacer:
+                start = time.perf_counter()
+                last = fibonacci.fibonacci(n - 1)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+            
+                col1, col2, col3 = st.columns(3)
+                col1.metric(f"Digits in term {n - 1:,}", f"{fibonacci.digit_count(last):,}")
+                col2.metric("Last 12 digits", f"{last % 10 ** 12:012d}")
+                col3.metric("Fast-doubling time", f"{elapsed_ms:.1f} ms")
+            
+                # Both charts are downsampled, then redrawn batch by batch as terms are computed
+                st.markdown("**Expression magnitude (log10 of each term)**")
+                growth = fibonacci.fibonacci_at(fibonacci.sample_indices(n, 2000))
+                stream_line_chart(chart_batches(
+                    ((index, fibonacci.log10_int(value)) for index, value in growth if value),
+                    "log10 Expression",
+                ), pacer)
+            
+                if not pacer.exhausted:
+                    st.markdown("**Ratio convergence (digits agreeing with the golden ratio, log-spaced terms)**")
+                    convergence = fibonacci.fibonacci_at(fibonacci.sample_indices(n - 1, 200, log_scale=True))
+                    stream_line_chart(chart_batches(
+                        ((index, fibonacci.ratio_agreement(index, value)) for index, value in convergence),
+                        "Matching digits",
+                        batch_size=50,
+                    ), pacer)
+                if pacer.exhausted:
+                    st.caption(f"Charts stopped after {pacer.budget:.0f} s; try fewer terms to see them in full")
+        
+        # Show golden ratio approximation
+        previous, current = fibonacci.fib_pair(n - 2)
+        st.write(f"**Expression Ratio:** {current / previous:.6f}")
+        st.write(f"**Expected Biological Ratio:** {(1 + math.sqrt(5)) / 2:.6f}")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
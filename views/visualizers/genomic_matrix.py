@@ -0,0 +1,61 @@
+"""Genomic Matrix: spiral fill shown as an animation or a heatmap"""
+import time
+
+import numpy as np
+import streamlit as st
+
+from algorithms import imaging, spiral
+from diagnostics.timings import timed
+from frame_player import frame_player
+from views.runs import limited_run
+
+
+@timed
+def render():
+    """Genomic matrix spiral: animated when small, a single heatmap image when large"""
+    st.markdown('<div class="algorithm-viz">', unsafe_allow_html=True)
+    size = st.slider("Matrix Size", 3, 4000, 4)
+    ring_reveal = st.checkbox("Reveal ring by ring", key="spiral_rings")
+    
+    if st.button("🧬 Generate Genomic Matrix", key="spiral"):
+        # Shares the process-wide cap on heavy runs with the other visualizers
+        with limited_run("Genomic matrix") as run:
+            start = time.perf_counter()
+            matrix = spiral.spiral_order(size)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        
+            if ring_reveal:
+                # One frame per ring (capped at 200); blocks appear once fully filled
+                ends = spiral.ring_ends(size)
+                picks = np.unique(np.linspace(0, len(ends) - 1, min(len(ends), 200)).astype(int))
+                frame_player(
+                    "grid",
+                    imaging.downsample(matrix, max_side=128, reduce="max"),
+                    ends[picks],
+                    interval_ms=150,
+                    title="Genomic Matrix",
+                    labels=[f"Ring {pick + 1} / {len(ends)}" for pick in picks],
+                    key="spiral_player",
+                )
+            elif size <= 16:
+                # Cells light up in fill order client-side instead of one rerun per cell
+                frame_player(
+                    "grid",
+                    matrix,
+                    range(1, size * size + 1),
+                    interval_ms=300,
+                    title="Genomic Matrix",
+                    key="spiral_player",
+                )
+            else:
+                st.image(
+                    imaging.heatmap_image(matrix),
+                    caption=f"{size:,}×{size:,} genomic matrix (downsampled heatmap)",
+                )
+        
+            st.caption(f"Spiral of {size * size:,} cells built in {elapsed_ms:.1f} ms")
+        
+        if run.completed:
+            st.success("🎉 Genomic Matrix Complete!")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
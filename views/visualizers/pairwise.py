@@ -0,0 +1,95 @@
+"""Pairwise Alignment: anti-diagonal DP with a score heatmap"""
+import time
+
+import numpy as np
+import streamlit as st
+
+from algorithms import alignment, imaging
+from diagnostics.timings import timed
+
+
+def random_related_pair(length, divergence=0.05):
+    """Random DNA sequence plus a copy carrying point mutations and small indels"""
+    rng = np.random.default_rng()
+    bases = np.frombuffer(b"ACGT", dtype=np.uint8)
+    original = rng.choice(bases, length)
+    roll = rng.random(length)
+    mutated = np.where(roll < divergence / 3, rng.choice(bases, length), original)
+    keep = roll >= divergence * 2 / 3
+    mutated = mutated[keep | (roll < divergence / 3)]
+    insert_at = np.flatnonzero(rng.random(len(mutated)) < divergence / 3)
+    mutated = np.insert(mutated, insert_at, rng.choice(bases, len(insert_at)))
+    return original.tobytes().decode(), mutated.tobytes().decode()
+
+
+@timed
+def render():
+    """Pairwise global/local alignment with the score matrix and traceback path"""
+    st.markdown('<div class="algorithm-viz">', unsafe_allow_html=True)
+    
+    source = st.radio("Sequences:", ["Type sequences", "Random related pair"], horizontal=True, key="align_source")
+    if source == "Type sequences":
+        seq_a = st.text_input("Sequence A:", "GATTACAGATTACA", key="align_a")
+        seq_b = st.text_input("Sequence B:", "GCATGCAGATCA", key="align_b")
+    else:
+        length = st.slider("Sequence length:", 100, 50000, 2000, key="align_length")
+    
+    mode = st.radio("Mode:", ["Global (Needleman–Wunsch)", "Local (Smith–Waterman)"], horizontal=True, key="align_mode")
+    col1, col2, col3 = st.columns(3)
+    # Bounded so int32 alignment scores cannot overflow
+    limit = alignment.MAX_SCORE
+    match = col1.number_input("Match", min_value=-limit, max_value=limit, value=1, key="align_match")
+    mismatch = col2.number_input("Mismatch", min_value=-limit, max_value=limit, value=-1, key="align_mismatch")
+    gap = col3.number_input("Gap", min_value=-limit, max_value=limit, value=-2, key="align_gap")
+    banded = st.checkbox("Banded (linear memory)", key="align_banded")
+    band = st.slider("Band width:", 5, 500, 100, key="align_band") if banded else None
+    
+    if st.button("🧬 Align Sequences", key="align"):
+        if source == "Random related pair":
+            seq_a, seq_b = random_related_pair(length)
+        seq_a = "".join(seq_a.split()).upper()
+        seq_b = "".join(seq_b.split()).upper()
+        
+        if not seq_a.isascii() or not seq_b.isascii():
+            st.error("❌ Sequences must contain only ASCII letters")
+        elif band is None and len(seq_a) * len(seq_b) > 25_000_000:
+            st.error("❌ Full matrices are limited to 25 million cells; enable banded mode for longer sequences")
+        else:
+            start = time.perf_counter()
+            try:
+                result = alignment.align(
+                    seq_a,
+                    seq_b,
+                    mode="local" if mode.startswith("Local") else "global",
+                    match=int(match),
+                    mismatch=int(mismatch),
+                    gap=int(gap),
+                    band=band,
+                )
+            except ValueError as error:
+                st.error(f"❌ {error}")
+                st.markdown('</div>', unsafe_allow_html=True)
+                return
+            elapsed = time.perf_counter() - start
+            
+            metric_cols = st.columns(4)
+            metric_cols[0].metric("Score", f"{result.score:,}")
+            metric_cols[1].metric("Identity", f"{result.identity():.1%}")
+            metric_cols[2].metric("Cells computed", f"{result.cells:,}")
+            metric_cols[3].metric("Time", f"{elapsed:.2f} s")
+            
+            # Sampled score matrix with the traceback path drawn on top
+            image = imaging.colorize(result.grid, mask=~np.isnan(result.grid))
+            imaging.draw_path(image, result.path[:, 0] // result.stride, result.path[:, 1] // result.stride)
+            st.image(
+                imaging.upscale(image),
+                caption=f"Score matrix ({len(seq_a):,} × {len(seq_b):,}, 1 pixel = {result.stride}×{result.stride} cells) with traceback path",
+            )
+            
+            preview = 120
+            st.code(
+                f"A  {result.aligned_a[:preview]}\n   {result.match_line()[:preview]}\nB  {result.aligned_b[:preview]}"
+                + ("\n…" if len(result.aligned_a) > preview else "")
+            )
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,147 @@
+"""Protein Pattern: Amino Acid Triangle, Codon Table and Protein Spiral"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from algorithms import codon, imaging, pascal
+from diagnostics.timings import timed
+
+# Worker processes translating large FASTA inputs
+TRANSLATION_WORKERS = os.cpu_count() or 1
+
+
+@st.cache_data
+def get_codon_table():
+    """Standard genetic code laid out as a first+second base by third base grid"""
+    bases = "TCAG"
+    return pd.DataFrame(
+        [[f"{first}{second}{third} → {codon.CODON_TABLE[first + second + third]}" for third in bases]
+         for first in bases for second in bases],
+        index=[f"{first}{second}·" for first in bases for second in bases],
+        columns=[f"·· {third}" for third in bases],
+    )
+
+
+@st.cache_resource
+def get_translation_pool():
+    """Process pool shared by all sessions for large translations"""
+    return ProcessPoolExecutor(max_workers=TRANSLATION_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+@st.cache_resource
+def get_pascal_triangle(modulus=None):
+    """Pascal row cache shared by every session in this process"""
+    return pascal.PascalTriangle(modulus)
+
+
+@timed
+def render():
+    """Interactive protein pattern visualization"""
+    st.markdown('<div class="algorithm-viz">', unsafe_allow_html=True)
+    pattern_type = st.selectbox("Choose Pattern:", ["Amino Acid Triangle", "Codon Table", "Protein Spiral"])
+    
+    if pattern_type == "Amino Acid Triangle":
+        view = st.radio(
+            "View:",
+            ["Exact values", "Sierpinski (odd entries)", "Residues mod m"],
+            horizontal=True,
+            key="pascal_view",
+        )
+        modulus = None
+        if view == "Exact values":
+            rows = st.slider("Number of rows:", 3, 5000, 5)
+        elif view == "Sierpinski (odd entries)":
+            rows = st.slider("Number of rows:", 3, 100000, 1024)
+        else:
+            rows = st.slider("Number of rows:", 3, 5000, 500)
+            modulus = st.number_input("Modulus m:", min_value=2, max_value=1000, value=3)
+        
+        if st.button("🔺 Generate Amino Acid Triangle", key="pascal"):
+            if view == "Exact values" and rows <= 20:
+                # Whole triangle as a single code block rather than one element per row
+                triangle = get_pascal_triangle()
+                width = len(str(max(triangle.row(rows - 1))))
+                lines = []
+                for i, row in enumerate(triangle.rows(0, rows)):
+                    spaces = " " * ((rows - i - 1) * (width + 1) // 2)
+                    numbers = " ".join(f"{num:>{width}d}" for num in row)
+                    lines.append(f"{spaces}{numbers}")
+                st.code("\n".join(lines))
+            elif view == "Exact values":
+                last_row = get_pascal_triangle().row(rows - 1)
+                central = last_row[len(last_row) // 2]
+                col1, col2 = st.columns(2)
+                col1.metric("Entries in last row", f"{len(last_row):,}")
+                col2.metric("Digits in central entry", f"{len(str(central)):,}")
+                st.code(" ".join(str(num) for num in last_row[:8]) + " …")
+            elif view == "Sierpinski (odd entries)":
+                odd, inside = pascal.odd_mask(rows)
+                st.image(
+                    imaging.upscale(imaging.colorize(odd, mask=inside)),
+                    caption=f"Odd entries of the first {rows:,} rows",
+                )
+            else:
+                grid, inside = pascal.residue_grid(get_pascal_triangle(modulus), rows)
+                st.image(
+                    imaging.upscale(imaging.colorize(grid, low=0, high=modulus - 1, mask=inside)),
+                    caption=f"First {rows:,} rows modulo {modulus}",
+                )
+    
+    elif pattern_type == "Codon Table":
+        st.dataframe(get_codon_table(), width="stretch")
+        
+        source = st.radio("Sequence source:", ["Paste sequence", "Upload FASTA"], horizontal=True, key="codon_source")
+        if source == "Paste sequence":
+            pasted = st.text_area("DNA sequence (raw or FASTA):", ">demo\nATGGCCATTGTAATGGGCCGCTGAAAGGGTGCCCGATAG")
+            uploaded = None
+        else:
+            pasted = ""
+            uploaded = st.file_uploader("FASTA file", type=["fa", "fasta", "fna", "txt"])
+        use_pool = st.checkbox("Translate in parallel worker processes", key="codon_pool")
+        
+        if st.button("🧬 Translate Sequence", key="codon_translate"):
+            stream = uploaded if uploaded is not None else BytesIO(pasted.encode())
+            executor = get_translation_pool() if use_pool else None
+            
+            rows = []
+            output = []
+            output_bytes = 0
+            total_bases = 0
+            start = time.perf_counter()
+            for name, length, frames in codon.translate_fasta(
+                stream, executor=executor, max_pending=2 * TRANSLATION_WORKERS
+            ):
+                total_bases += length
+                for label, protein in frames.items():
+                    if len(rows) < 120:
+                        rows.append({
+                            "Record": name or "sequence",
+                            "Frame": label,
+                            "Length (aa)": len(protein),
+                            "Stops": protein.count(b"*"),
+                            "Preview": protein[:60].decode("ascii"),
+                        })
+                    output_bytes += len(protein)
+                    if output_bytes <= 20 * 1024 * 1024:
+                        output.append(f">{name or 'sequence'} frame {label}\n{protein.decode('ascii')}\n")
+            elapsed = time.perf_counter() - start
+            
+            if not rows:
+                st.error("❌ No sequence found in the input")
+            else:
+                st.caption(
+                    f"Translated {total_bases:,} bases in all six frames in {elapsed:.2f} s "
+                    f"({total_bases / max(elapsed, 1e-9) / 1e6:.1f} Mb/s)"
+                )
+                st.dataframe(pd.DataFrame(rows), width="stretch")
+                if output_bytes <= 20 * 1024 * 1024:
+                    st.download_button("📥 Download proteins (FASTA)", "".join(output), file_name="translation.fasta")
+                else:
+                    st.info("Translation is larger than 20 MB; showing the summary only.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
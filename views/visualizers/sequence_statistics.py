@@ -0,0 +1,124 @@
+"""Sequence Statistics: GC content, GC skew and k-mer spectra"""
+import os
+import time
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from algorithms import expression, seqstats
+from diagnostics.timings import timed
+from views.shared import GENOME_DIR, stage_upload
+
+
+@st.cache_resource(show_spinner="Scanning sequence...", max_entries=4)
+def get_sequence_stats(path, modified, k):
+    """Block counts and k-mer table for one sequence file (None = synthetic genome)"""
+    start = time.perf_counter()
+    if path is None:
+        profiles, kmer_counts = seqstats.scan_sequences(BytesIO(seqstats.synthetic_genome()), k=k)
+    else:
+        with open(path, "rb") as f:
+            profiles, kmer_counts = seqstats.scan_sequences(f, k=k)
+    return profiles, kmer_counts, time.perf_counter() - start
+
+
+# Points sent to the browser per profile chart
+CHART_POINTS = 4000
+
+
+def profile_chart(centres, values, label):
+    """Line chart of one window profile, min/max downsampled on its own values"""
+    keep = expression.minmax_indices(values, CHART_POINTS)
+    index = pd.Index(centres[keep].astype(np.int64), name="Position (bp)")
+    st.line_chart(pd.DataFrame({label: values[keep]}, index=index))
+
+
+@timed
+def render():
+    """GC content, GC skew and k-mer spectra with instant window changes"""
+    st.markdown('<div class="algorithm-viz">', unsafe_allow_html=True)
+    source = st.radio(
+        "Sequence:", ["Synthetic genome", "Upload FASTA", "Local reference"], horizontal=True, key="seqstats_source"
+    )
+    path, modified = None, None
+    if source == "Upload FASTA":
+        uploaded = st.file_uploader("FASTA file", type=["fa", "fasta", "fna", "txt"], key="seqstats_upload")
+        if uploaded is None:
+            st.info("Upload a FASTA file to profile it.")
+            st.markdown('</div>', unsafe_allow_html=True)
+            return
+        path = stage_upload(uploaded)
+    elif source == "Local reference":
+        references = sorted(
+            name for name in os.listdir(GENOME_DIR) if name.endswith((".fa", ".fasta", ".fna"))
+        ) if os.path.isdir(GENOME_DIR) else []
+        if not references:
+            st.info(f"No reference files found in {GENOME_DIR}.")
+            st.markdown('</div>', unsafe_allow_html=True)
+            return
+        path = os.path.join(GENOME_DIR, st.selectbox("Reference file:", references, key="seqstats_reference"))
+    if path is not None:
+        modified = os.path.getmtime(path)
+    
+    k = st.slider("k-mer length:", 1, seqstats.MAX_K, 6, key="seqstats_k")
+    profiles, kmer_counts, scan_seconds = get_sequence_stats(path, modified, k)
+    if not profiles:
+        st.error("❌ No sequence found in the input")
+        st.markdown('</div>', unsafe_allow_html=True)
+        return
+    
+    names = [profile.name for profile in profiles]
+    profile = profiles[st.selectbox("Record:", range(len(names)), format_func=names.__getitem__, key="seqstats_record")]
+    col1, col2 = st.columns(2)
+    window = col1.select_slider(
+        "Window (bases):",
+        [200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000],
+        value=10000,
+        key="seqstats_window",
+    )
+    overlap = col2.slider("Window overlap (%):", 0, 90, 50, step=10, key="seqstats_overlap")
+    
+    start = time.perf_counter()
+    centres, content, skew, cumulative = profile.windows(window, window * (100 - overlap) / 100)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    composition = profile.composition()
+    known = sum(composition[base] for base in "ACGT")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Length", f"{profile.length:,} bp")
+    col2.metric("GC content", f"{100 * (composition['G'] + composition['C']) / max(known, 1):.2f}%")
+    col3.metric("Windows", f"{len(centres):,}")
+    st.caption(f"Scanned once in {scan_seconds:.2f} s · {len(centres):,} windows computed in {elapsed_ms:.1f} ms")
+    
+    # Min/max downsampling keeps each profile's own peaks within a few thousand points
+    st.markdown("**GC content (%)**")
+    profile_chart(centres, 100 * content, "GC %")
+    st.markdown("**GC skew (G − C) / (G + C)**")
+    profile_chart(centres, skew, "GC skew")
+    st.markdown("**Cumulative GC skew**")
+    profile_chart(centres, cumulative, "Cumulative G − C")
+    if len(cumulative):
+        st.caption(
+            f"Likely origin near {int(centres[cumulative.argmin()]):,} bp, "
+            f"terminus near {int(centres[cumulative.argmax()]):,} bp"
+        )
+    
+    st.markdown(f"**{k}-mer spectrum (all records, forward strand)**")
+    observed = int(np.count_nonzero(kmer_counts))
+    st.caption(f"{observed:,} of {4 ** k:,} possible {k}-mers observed")
+    col1, col2 = st.columns(2)
+    spectrum = seqstats.kmer_spectrum(kmer_counts)
+    shown = int(np.percentile(kmer_counts, 99.9)) + 1
+    col1.bar_chart(pd.DataFrame(
+        {"Distinct k-mers": spectrum[1:shown + 1]},
+        index=pd.Index(np.arange(1, len(spectrum[1:shown + 1]) + 1), name="Occurrences"),
+    ))
+    col2.dataframe(
+        pd.DataFrame(seqstats.top_kmers(kmer_counts, k), columns=["k-mer", "Count"]),
+        width="stretch",
+        hide_index=True,
+    )
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,49 @@
+"""Sequence Alignment Sort: recorded sort traces replayed in the browser"""
+import numpy as np
+import streamlit as st
+
+from algorithms import sort_trace
+from diagnostics.timings import timed
+from frame_player import frame_player
+from views.runs import limited_run
+
+
+@timed
+def render():
+    """Animated sequence alignment visualization replayed from a recorded sort trace"""
+    st.markdown('<div class="algorithm-viz">', unsafe_allow_html=True)
+    
+    algorithm = st.selectbox("Sorting algorithm:", list(sort_trace.ALGORITHMS), key="sort_algorithm")
+    max_size = sort_trace.MAX_SIZE[algorithm]
+    size = st.slider("Sequence length:", 10, max_size, min(100, max_size), key="sort_size")
+    max_frames = st.slider("Animation frames:", 10, 200, 60, key="sort_frames")
+    
+    if st.button("🧬 Start Sequence Alignment Animation", key="bubble_sort"):
+        # Shares the process-wide cap on heavy runs with the other visualizers
+        with limited_run("Sequence alignment sort") as run:
+            data = np.random.randint(1, 100, size)
+        
+            # Run the sort once; playback only replays the recorded operation log
+            trace = sort_trace.trace_sort(data, algorithm)
+            counts = trace.counts()
+            st.caption(
+                f"{len(trace):,} operations recorded: {counts['compare']:,} compares, "
+                f"{counts['swap']:,} swaps, {counts['write']:,} writes"
+            )
+        
+            # Ship every frame in one payload; the browser handles play/pause/scrub
+            steps, frames = zip(*trace.frames(max_frames, max_bars=500))
+            frame_player(
+                "bars",
+                np.vstack(frames),
+                steps,
+                interval_ms=100,
+                title="Expression Level",
+                labels=[f"Operation {step:,} / {len(trace):,}" for step in steps],
+                key="sort_player",
+            )
+        
+        if run.completed:
+            st.success("✅ Sequence Alignment Complete!")
+    
+    st.markdown('</div>', unsafe_allow_html=True)